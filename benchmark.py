@@ -0,0 +1,422 @@
+# Name: Seongyeong Ju
+# OSU Email: jus@oregonstate.edu
+# Course: CS261 - Data Structures
+# Description: Timing benchmark for MinHeap and DynamicArray hot paths
+
+
+import argparse
+import json
+import platform
+import random
+import sys
+import threading
+import time
+import tracemalloc
+
+from concurrent_min_heap import ConcurrentMinHeap
+from min_heap import *
+
+
+def time_call(func, *args) -> float:
+    """
+    Return the wall-clock seconds taken by one call of func(*args)
+    """
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def random_values(size: int, seed: int = 0, typecode=None) -> DynamicArray:
+    """
+    Return a DynamicArray of size random integers in [0, size)
+    """
+    rng = random.Random(seed)
+    values = DynamicArray(typecode=typecode)
+    for _ in range(size):
+        values.append(rng.randrange(size))
+    return values
+
+
+def bench_add(values: DynamicArray, typecode=None, arity=2) -> None:
+    """
+    Add every value to an empty MinHeap one at a time
+    """
+    h = MinHeap(typecode=typecode, arity=arity)
+    for value in values:
+        h.add(value)
+
+
+def bench_remove_min(h: MinHeap) -> None:
+    """
+    Remove every element from the heap
+    """
+    while not h.is_empty():
+        h.remove_min()
+
+
+def bench_build_heap(values: DynamicArray) -> None:
+    """
+    Build a MinHeap from values in one call
+    """
+    MinHeap().build_heap(values)
+
+
+def bench_mixed(h: MinHeap, values: DynamicArray) -> None:
+    """
+    Interleave add, pushpop and remove_min on a populated heap
+    """
+    for index in range(values.length()):
+        step = index % 3
+        if step == 0:
+            h.add(values[index])
+        elif step == 1:
+            h.pushpop(values[index])
+        else:
+            h.remove_min()
+
+
+def run(size: int, seed: int = 0) -> None:
+    """
+    Time add, remove_min, build_heap and heapsort on size random integers
+    """
+    values = random_values(size, seed)
+    h = MinHeap()
+    h.build_heap(values)
+
+    results = (
+        ("add", time_call(bench_add, values)),
+        ("remove_min", time_call(bench_remove_min, h)),
+        ("build_heap", time_call(bench_build_heap, values)),
+        ("heapsort", time_call(heapsort, DynamicArray(values))),
+    )
+    for name, seconds in results:
+        print(f"{name:<12} n={size:<9} {seconds:9.3f} s")
+
+
+def run_arity_matrix(sizes, arities, typecode=None, seed: int = 0) -> None:
+    """
+    Time push-heavy, pop-heavy and mixed workloads for every combination of
+    heap size and arity
+    """
+    print(f"{'workload':<10} {'n':>9} " + " ".join(f"{'d=' + str(d):>9}" for d in arities))
+    for size in sizes:
+        values = random_values(size, seed, typecode)
+        rows = (("push", []), ("pop", []), ("mixed", []))
+        for arity in arities:
+            rows[0][1].append(time_call(bench_add, values, typecode, arity))
+            h = MinHeap.from_iterable(values, typecode, arity=arity)
+            rows[1][1].append(time_call(bench_remove_min, h))
+            h = MinHeap.from_iterable(values, typecode, arity=arity)
+            rows[2][1].append(time_call(bench_mixed, h, values))
+        for name, times in rows:
+            print(f"{name:<10} {size:>9} " + " ".join(f"{t:8.3f}s" for t in times))
+
+
+def bench_contention(threads: int, items: int, batch: int) -> float:
+    """
+    Move items objects through a ConcurrentMinHeap with threads producers
+    and threads consumers, in batches of batch objects when batch > 1, and
+    return the wall-clock seconds taken
+    """
+    h = ConcurrentMinHeap()
+    per_thread = items // threads
+
+    def produce(seed):
+        rng = random.Random(seed)
+        sent = 0
+        while sent < per_thread:
+            count = min(batch, per_thread - sent)
+            if batch > 1:
+                h.put_many([rng.random() for _ in range(count)])
+            else:
+                h.put(rng.random())
+            sent += count
+
+    def consume():
+        received = 0
+        while received < per_thread:
+            if batch > 1:
+                received += h.get_many(min(batch, per_thread - received)).length()
+            else:
+                h.get()
+                received += 1
+
+    workers = [threading.Thread(target=produce, args=(i,)) for i in range(threads)]
+    workers += [threading.Thread(target=consume) for _ in range(threads)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return time.perf_counter() - start
+
+
+def run_contention(thread_counts, items: int, batch: int) -> None:
+    """
+    Print throughput of ConcurrentMinHeap for every producer/consumer
+    thread count, one object at a time and batched
+    """
+    print(f"{'threads':>7} {'single ops/s':>14} {'batch=' + str(batch) + ' ops/s':>16}")
+    for threads in thread_counts:
+        single = bench_contention(threads, items, 1)
+        batched = bench_contention(threads, items, batch)
+        print(f"{threads:>7} {items / single:>14,.0f} {items / batched:>16,.0f}")
+
+# ------------------- REPRODUCIBLE SUITE ----------------------------------
+
+
+INPUTS = ("random", "sorted", "reverse", "duplicates")
+
+
+class Counted:
+    """
+    Wrapper around a value that counts every comparison made on it
+    """
+
+    __slots__ = ("value",)
+    comparisons = 0
+
+    def __init__(self, value):
+        self.value = value
+
+    def __lt__(self, other: "Counted") -> bool:
+        Counted.comparisons += 1
+        return self.value < other.value
+
+    def __le__(self, other: "Counted") -> bool:
+        Counted.comparisons += 1
+        return self.value <= other.value
+
+    def __gt__(self, other: "Counted") -> bool:
+        Counted.comparisons += 1
+        return self.value > other.value
+
+    def __ge__(self, other: "Counted") -> bool:
+        Counted.comparisons += 1
+        return self.value >= other.value
+
+    def __eq__(self, other: "Counted") -> bool:
+        Counted.comparisons += 1
+        return self.value == other.value
+
+
+def input_values(kind: str, size: int, seed: int = 0, typecode=None) -> DynamicArray:
+    """
+    Return a DynamicArray of size integers laid out as kind: random,
+    sorted, reverse (sorted descending) or duplicates (16 distinct values)
+    """
+    if kind == "random":
+        return random_values(size, seed, typecode)
+    if kind == "sorted":
+        return DynamicArray(range(size), typecode)
+    if kind == "reverse":
+        return DynamicArray(range(size, 0, -1), typecode)
+    rng = random.Random(seed)
+    values = DynamicArray(typecode=typecode)
+    for _ in range(size):
+        values.append(rng.randrange(16))
+    return values
+
+
+def measure(setup, func, ops: int, count: bool = False, repeat: int = 3) -> dict:
+    """
+    Run func(*setup()) timed (best of repeat runs), then once under
+    tracemalloc for peak memory and, when count is True, once on Counted
+    values for the number of comparisons
+    setup receives a wrap function to apply to every value, or None
+    """
+    seconds = None
+    for _ in range(repeat):
+        args = setup(None)
+        start = time.perf_counter()
+        func(*args)
+        elapsed = time.perf_counter() - start
+        if seconds is None or elapsed < seconds:
+            seconds = elapsed
+
+    args = setup(None)
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    func(*args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    comparisons = None
+    if count:
+        args = setup(Counted)
+        Counted.comparisons = 0
+        func(*args)
+        comparisons = Counted.comparisons
+
+    return {"ops": ops, "seconds": seconds,
+            "ops_per_sec": ops / seconds if seconds > 0 else None,
+            "peak_bytes": peak, "comparisons": comparisons}
+
+
+def heap_cases(values: DynamicArray, typecode=None):
+    """
+    Yield (name, setup, func, ops) for the MinHeap benchmarks on values
+    """
+    size = values.length()
+
+    def source(wrap):
+        if wrap is None:
+            return DynamicArray(values, typecode)
+        return values.map(wrap)
+
+    def filled_heap(wrap):
+        h = MinHeap(typecode=None if wrap else typecode)
+        h.build_heap(source(wrap))
+        return (h,)
+
+    yield ("heap.add", lambda wrap: (source(wrap), None if wrap else typecode),
+           bench_add, size)
+    yield "heap.remove_min", filled_heap, bench_remove_min, size
+    yield "heap.build_heap", lambda wrap: (source(wrap),), bench_build_heap, size
+    yield "heap.heapsort", lambda wrap: (source(wrap),), heapsort, size
+
+
+def array_cases(size: int, typecode=None):
+    """
+    Yield (name, setup, func, ops) for the DynamicArray benchmarks on an
+    array of size elements; the O(N) insert/remove run up to 1000 times,
+    fewer on large arrays
+    """
+    edits = max(1, min(size, 1000, 1000000 // size))
+
+    def filled(wrap):
+        return (DynamicArray(range(size), typecode),)
+
+    def append(da):
+        for value in range(size):
+            da.append(value)
+
+    def insert(da):
+        for value in range(edits):
+            da.insert_at_index(da.length() // 2, value)
+
+    def remove(da):
+        for _ in range(edits):
+            da.remove_at_index(da.length() // 2)
+
+    def resize(da):
+        for _ in range(5):
+            da.resize(2 * size)
+            da.resize(size)
+
+    def slice_half(da):
+        for start in range(10):
+            da.slice(start, size // 2)
+
+    yield "array.append", lambda wrap: (DynamicArray(typecode=typecode),), append, size
+    yield "array.insert_at_index", filled, insert, edits
+    yield "array.remove_at_index", filled, remove, edits
+    yield "array.resize", filled, resize, 10
+    yield ("array.merge", lambda wrap: filled(wrap) + filled(wrap),
+           DynamicArray.merge, size)
+    yield "array.slice", filled, slice_half, 10
+
+
+def run_suite(sizes, typecode=None, seed: int = 0, repeat: int = 3) -> dict:
+    """
+    Run every MinHeap case on every input kind and every DynamicArray case
+    for each size, and return the results as a JSON-serializable dict
+    """
+    results = []
+    for size in sizes:
+        for kind in INPUTS:
+            values = input_values(kind, size, seed, typecode)
+            for name, setup, func, ops in heap_cases(values, typecode):
+                result = {"name": name, "input": kind, "n": size}
+                result.update(measure(setup, func, ops, True, repeat))
+                results.append(result)
+                print(f"{name:<22} {kind:<10} n={size:<9} "
+                      f"{result['ops_per_sec']:>14,.0f} ops/s", file=sys.stderr)
+        for name, setup, func, ops in array_cases(size, typecode):
+            result = {"name": name, "input": "range", "n": size}
+            result.update(measure(setup, func, ops, False, repeat))
+            results.append(result)
+            print(f"{name:<22} {'range':<10} n={size:<9} "
+                  f"{result['ops_per_sec']:>14,.0f} ops/s", file=sys.stderr)
+    return {"python": platform.python_version(), "platform": platform.platform(),
+            "typecode": typecode, "seed": seed, "repeat": repeat,
+            "results": results}
+
+
+def compare_baseline(report: dict, baseline: dict, tolerance: float) -> DynamicArray:
+    """
+    Return a DynamicArray of messages for every case that is more than
+    tolerance (a fraction) slower than the baseline or makes more
+    comparisons; cases missing from either side are ignored
+    """
+    expected = {}
+    for result in baseline["results"]:
+        expected[(result["name"], result["input"], result["n"])] = result
+    regressions = DynamicArray()
+    for result in report["results"]:
+        old = expected.get((result["name"], result["input"], result["n"]))
+        if old is None:
+            continue
+        case = f"{result['name']} {result['input']} n={result['n']}"
+        if (old["ops_per_sec"] and result["ops_per_sec"]
+                and result["ops_per_sec"] < old["ops_per_sec"] * (1 - tolerance)):
+            regressions.append(f"{case}: {result['ops_per_sec']:,.0f} ops/s, "
+                               f"baseline {old['ops_per_sec']:,.0f} ops/s")
+        if (old["comparisons"] is not None and result["comparisons"] is not None
+                and result["comparisons"] > old["comparisons"]):
+            regressions.append(f"{case}: {result['comparisons']} comparisons, "
+                               f"baseline {old['comparisons']}")
+    return regressions
+
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="MinHeap and DynamicArray benchmarks")
+    parser.add_argument("size", nargs="?", type=int, default=1000000)
+    parser.add_argument("--arity-matrix", action="store_true",
+                        help="compare heap arities on push/pop/mixed workloads")
+    parser.add_argument("--suite", action="store_true",
+                        help="run the full suite and print JSON results")
+    parser.add_argument("--sizes", type=int, nargs="+", default=None)
+    parser.add_argument("--arities", type=int, nargs="+", default=[2, 4, 8])
+    parser.add_argument("--typecode", default=None,
+                        help="array typecode for typed heaps, e.g. q")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="timed runs per suite case, the best is kept")
+    parser.add_argument("--output", default=None,
+                        help="write suite results to this JSON file")
+    parser.add_argument("--baseline", default=None,
+                        help="fail if the suite regresses against this JSON file")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="allowed ops/s slowdown against the baseline")
+    parser.add_argument("--contention", action="store_true",
+                        help="measure ConcurrentMinHeap throughput per thread count")
+    parser.add_argument("--threads", type=int, nargs="+",
+                        default=[1, 2, 4, 8, 16, 32])
+    parser.add_argument("--batch", type=int, default=100)
+    args = parser.parse_args()
+
+    if args.suite:
+        report = run_suite(args.sizes or [1000, 10000, 100000, 1000000],
+                           args.typecode, args.seed, args.repeat)
+        if args.output is None:
+            print(json.dumps(report, indent=2))
+        else:
+            with open(args.output, "w") as output:
+                json.dump(report, output, indent=2)
+        if args.baseline is not None:
+            with open(args.baseline) as baseline:
+                regressions = compare_baseline(report, json.load(baseline),
+                                               args.tolerance)
+            for message in regressions:
+                print("REGRESSION " + message, file=sys.stderr)
+            if not regressions.is_empty():
+                sys.exit(1)
+    elif args.arity_matrix:
+        run_arity_matrix(args.sizes or [10000, 100000, 1000000], args.arities,
+                         args.typecode)
+    elif args.contention:
+        run_contention(args.threads, args.size, args.batch)
+    else:
+        run(args.size)
@@ -0,0 +1,413 @@
+# Name: Seongyeong Ju
+# OSU Email: jus@oregonstate.edu
+# Course: CS261 - Data Structures
+# Description: Thread-safe and asyncio-friendly wrappers around MinHeap
+
+
+import asyncio
+import threading
+import time
+
+from min_heap import *
+
+
+class ConcurrentMinHeap:
+    """
+    MinHeap shared between threads
+    One lock guards the heap and is held only for the heap operation itself;
+    blocked producers and consumers wait on conditions of that lock instead
+    of polling. The batched put_many/get_many take the lock once per batch
+    """
+
+    def __init__(self, start_heap=None, maxsize: int = 0, **heap_options):
+        """
+        Initialize a new ConcurrentMinHeap
+        maxsize > 0 bounds the heap so put() blocks while it is full
+        heap_options (typecode, key, arity) are passed to MinHeap
+        """
+        self._heap = MinHeap(start_heap, **heap_options)
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+        self._async_waiters = DynamicArray()
+
+    def __str__(self) -> str:
+        """
+        Return content in human-readable form
+        """
+        with self._lock:
+            return 'CONCURRENT ' + str(self._heap)
+
+    def put(self, node: object, block: bool = True, timeout: float = None) -> None:
+        """
+        Adds new object, waiting up to timeout seconds for room in a bounded
+        heap, and raises a MinHeapException if there is still no room
+        """
+        with self._not_full:
+            self._wait_for_room(1, block, timeout)
+            self._heap.add(node)
+            self._changed()
+
+    def put_many(self, values, block: bool = True, timeout: float = None) -> None:
+        """
+        Adds every object from values under a single lock acquisition
+        A bounded heap waits up to timeout seconds until the whole batch
+        fits and raises a MinHeapException otherwise, immediately if the
+        batch is larger than maxsize
+        """
+        batch = DynamicArray(values)
+        if batch.is_empty():
+            return
+        with self._not_full:
+            self._wait_for_room(batch.length(), block, timeout)
+            self._heap.push_many(batch)
+            self._changed()
+
+    def get(self, block: bool = True, timeout: float = None) -> object:
+        """
+        Removes and returns the minimum object, waiting up to timeout seconds
+        for one to arrive, and raises a MinHeapException if the heap is
+        still empty
+        """
+        with self._not_empty:
+            self._wait_for_item(block, timeout)
+            node = self._heap.remove_min()
+            self._changed()
+            return node
+
+    def get_many(self, k: int, block: bool = True, timeout: float = None) -> DynamicArray:
+        """
+        Removes up to k minimum objects under a single lock acquisition and
+        returns them in ascending order, waiting up to timeout seconds for
+        at least one object and raising a MinHeapException if none arrives
+        """
+        with self._not_empty:
+            self._wait_for_item(block, timeout)
+            nodes = self._heap.pop_many(k)
+            self._changed()
+            return nodes
+
+    def get_min(self) -> object:
+        """
+        Returns the minimum object without removing it and raises a
+        MinHeapException if heap is empty
+        """
+        with self._lock:
+            return self._heap.get_min()
+
+    def size(self) -> int:
+        """
+        Returns the number of objects currently stored in the heap
+        """
+        with self._lock:
+            return self._heap.size()
+
+    def is_empty(self) -> bool:
+        """
+        Returns True if heap is empty and False otherwise
+        """
+        with self._lock:
+            return self._heap.is_empty()
+
+    def _wait_for_room(self, count: int, block: bool, timeout: float) -> None:
+        """
+        Helper method to wait, with the lock held, until count more objects
+        fit into a bounded heap
+        """
+        if self._maxsize <= 0:
+            return
+        if count > self._maxsize:
+            raise MinHeapException      # the batch can never fit
+        if not self._not_full.wait_for(
+                lambda: self._heap.size() + count <= self._maxsize,
+                timeout if block else 0):
+            raise MinHeapException
+
+    def _wait_for_item(self, block: bool, timeout: float) -> None:
+        """
+        Helper method to wait, with the lock held, until the heap holds at
+        least one object
+        """
+        if not self._not_empty.wait_for(lambda: not self._heap.is_empty(),
+                                        timeout if block else 0):
+            raise MinHeapException
+
+    def _changed(self) -> None:
+        """
+        Helper method to wake waiting threads and asyncio tasks after the
+        heap changed, with the lock held
+        Woken waiters re-check the heap, so waking too many is harmless.
+        Consumers all wait for the same thing and each one that takes an
+        object wakes the next, but producers wait for room for batches of
+        different sizes, so all of them re-check: the one woken might not
+        fit while another would
+        """
+        self._not_empty.notify()
+        self._not_full.notify_all()
+        while not self._async_waiters.is_empty():
+            loop, future = self._async_waiters.pop()
+            loop.call_soon_threadsafe(_wake, future)
+
+    def _register(self, loop, room_for: int = 0):
+        """
+        Helper method for AsyncMinHeap: returns a future that completes at
+        the next change of the heap, or None if the heap already holds an
+        object (room_for == 0) or has room for room_for objects
+        """
+        with self._lock:
+            if room_for == 0:
+                ready = not self._heap.is_empty()
+            elif self._maxsize > 0 and room_for > self._maxsize:
+                raise MinHeapException
+            else:
+                ready = (self._maxsize <= 0
+                         or self._heap.size() + room_for <= self._maxsize)
+            if ready:
+                return None
+            future = loop.create_future()
+            self._async_waiters.append((loop, future))
+            return future
+
+
+class AsyncMinHeap:
+    """
+    asyncio front end of a ConcurrentMinHeap
+    Coroutines wait for objects (or room) without blocking the event loop,
+    and may share the underlying heap with ordinary threads, whose puts and
+    gets wake waiting tasks through the event loop
+    """
+
+    def __init__(self, start_heap=None, maxsize: int = 0, heap=None, **heap_options):
+        """
+        Initialize a new AsyncMinHeap, wrapping heap if a ConcurrentMinHeap
+        is given or creating one from the remaining arguments otherwise
+        """
+        if heap is None:
+            heap = ConcurrentMinHeap(start_heap, maxsize, **heap_options)
+        self._heap = heap
+
+    def __str__(self) -> str:
+        """
+        Return content in human-readable form
+        """
+        return 'ASYNC ' + str(self._heap)
+
+    def get_heap(self) -> ConcurrentMinHeap:
+        """
+        Returns the underlying ConcurrentMinHeap for use from threads
+        """
+        return self._heap
+
+    async def put(self, node: object, timeout: float = None) -> None:
+        """
+        Adds new object, waiting up to timeout seconds for room in a bounded
+        heap, and raises a MinHeapException if there is still no room
+        """
+        deadline = _deadline(timeout)
+        while True:
+            await self._wait(1, deadline)
+            try:
+                self._heap.put(node, block=False)
+                return
+            except MinHeapException:
+                pass    # another producer took the room, wait again
+
+    async def put_many(self, values, timeout: float = None) -> None:
+        """
+        Adds every object from values under a single lock acquisition,
+        waiting up to timeout seconds until the whole batch fits
+        Raises a MinHeapException on timeout or if the batch is larger than
+        maxsize
+        """
+        batch = DynamicArray(values)
+        deadline = _deadline(timeout)
+        while True:
+            await self._wait(max(batch.length(), 1), deadline)
+            try:
+                self._heap.put_many(batch, block=False)
+                return
+            except MinHeapException:
+                pass
+
+    async def get(self, timeout: float = None) -> object:
+        """
+        Removes and returns the minimum object, waiting up to timeout seconds
+        for one to arrive, and raises a MinHeapException on timeout
+        """
+        deadline = _deadline(timeout)
+        while True:
+            await self._wait(0, deadline)
+            try:
+                return self._heap.get(block=False)
+            except MinHeapException:
+                pass    # another consumer took the object, wait again
+
+    async def get_many(self, k: int, timeout: float = None) -> DynamicArray:
+        """
+        Removes up to k minimum objects under a single lock acquisition and
+        returns them in ascending order, waiting up to timeout seconds for
+        at least one object
+        """
+        deadline = _deadline(timeout)
+        while True:
+            await self._wait(0, deadline)
+            try:
+                return self._heap.get_many(k, block=False)
+            except MinHeapException:
+                pass
+
+    def get_nowait(self) -> object:
+        """
+        Removes and returns the minimum object and raises a MinHeapException
+        if the heap is empty
+        """
+        return self._heap.get(block=False)
+
+    def put_nowait(self, node: object) -> None:
+        """
+        Adds new object and raises a MinHeapException if a bounded heap is full
+        """
+        self._heap.put(node, block=False)
+
+    def size(self) -> int:
+        """
+        Returns the number of objects currently stored in the heap
+        """
+        return self._heap.size()
+
+    def is_empty(self) -> bool:
+        """
+        Returns True if heap is empty and False otherwise
+        """
+        return self._heap.is_empty()
+
+    async def _wait(self, room_for: int, deadline: float) -> None:
+        """
+        Helper method to wait until the heap holds an object (room_for == 0)
+        or has room for room_for objects, raising a MinHeapException once
+        the monotonic deadline has passed
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            future = self._heap._register(loop, room_for)
+            if future is None:
+                return
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                raise MinHeapException
+            try:
+                await asyncio.wait_for(future, remaining)
+            except asyncio.TimeoutError:
+                raise MinHeapException
+
+
+def _deadline(timeout: float) -> float:
+    """
+    Helper function to turn a timeout in seconds into a monotonic deadline
+    """
+    return None if timeout is None else time.monotonic() + timeout
+
+
+def _wake(future) -> None:
+    """
+    Helper function run on the event loop to complete a waiter future
+    """
+    if not future.done():
+        future.set_result(None)
+
+
+# ------------------- BASIC TESTING -----------------------------------------
+
+
+if __name__ == '__main__':
+
+    print("\nbounded put example 1")
+    print("---------------------")
+    h = ConcurrentMinHeap(range(10), maxsize=10)
+    results = DynamicArray()
+
+    def producer(name, call, *args):
+        start = time.monotonic()
+        try:
+            call(*args, timeout=3)
+            results.append((name, "added", time.monotonic() - start < 1))
+        except MinHeapException:
+            results.append((name, "timed out", time.monotonic() - start < 1))
+
+    batch = threading.Thread(target=producer, args=("batch", h.put_many, [100] * 5))
+    single = threading.Thread(target=producer, args=("single", h.put, 200))
+    batch.start()
+    time.sleep(0.1)
+    single.start()
+    time.sleep(0.1)
+    print(h.get(), h.size())
+    single.join()
+    print(results[0], h.size())
+    batch.join()
+    print(results[1], h.size())
+
+    print("\ntimeout example 1")
+    print("-----------------")
+    h = ConcurrentMinHeap(maxsize=3)
+    for call, args in ((h.get, ()), (h.get_many, (2,)),
+                       (h.put_many, ([1, 2, 3, 4],))):
+        try:
+            call(*args, timeout=0.05)
+            print("returned")
+        except MinHeapException as e:
+            print("Exception raised:", type(e))
+    h.put_many([30, 10, 20])
+    try:
+        h.put(5, block=False)
+    except MinHeapException as e:
+        print("Exception raised:", type(e))
+    print(h)
+    print(h.get_many(2), h.get_min())
+
+    print("\nthreads example 1")
+    print("-----------------")
+    h = ConcurrentMinHeap(maxsize=8, typecode='q')
+    received = DynamicArray(typecode='q')
+
+    def consume():
+        while received.length() < 100:
+            received.extend(h.get_many(5, timeout=3))
+
+    consumer = threading.Thread(target=consume)
+    consumer.start()
+    for value in range(99, -1, -1):
+        h.put(value, timeout=3)
+    consumer.join()
+    print(received.length(), sorted(received) == list(range(100)), h.is_empty())
+
+    print("\nasync example 1")
+    print("---------------")
+
+    async def handoff():
+        heap = AsyncMinHeap(maxsize=2)
+        shared = heap.get_heap()
+
+        def feed():
+            for value in (30, 10, 20):
+                shared.put(value, timeout=3)
+
+        feeder = threading.Thread(target=feed)
+        feeder.start()
+        received = DynamicArray()
+        for _ in range(3):
+            received.append(await heap.get(timeout=3))
+        await asyncio.to_thread(feeder.join)
+        print(sorted(received), heap.is_empty())
+        await heap.put_many([5, 1], timeout=3)
+        try:
+            await heap.put(0, timeout=0.05)
+        except MinHeapException as e:
+            print("Exception raised:", type(e))
+        try:
+            await heap.put_many([1, 2, 3])
+        except MinHeapException as e:
+            print("Exception raised:", type(e))
+        print(await heap.get_many(3), heap.is_empty())
+
+    asyncio.run(handoff())
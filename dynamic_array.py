@@ -6,8 +6,33 @@
 # Description: Dynamic Array Implementation
 
 
+import builtins
+import functools
+import mmap
+import operator
+import os
+import pickle
+import struct
+import sys
+from array import array
+from itertools import compress, repeat
+
 from static_array import StaticArray
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+_POINTER_SIZE = struct.calcsize("P")    # bytes per object reference
+_NUMERIC_TYPECODES = "bBhHiIlLqQfd"     # memoryview- and NumPy-compatible
+
+# snapshot file header: magic, typecode (NUL in object mode), byte order,
+# kind (0 for a DynamicArray), size, and two fields reserved for MinHeap
+_SNAPSHOT_MAGIC = b"CS261DA\x00"
+_SNAPSHOT_HEADER = struct.Struct("<8sccB5xqqq")
+
 
 class DynamicArrayException(Exception):
     """
@@ -17,21 +42,271 @@ class DynamicArrayException(Exception):
     pass
 
 
+class GrowthPolicy:
+    """
+    Capacity policy used by DynamicArray when it grows or shrinks
+    The defaults match the original behaviour: double capacity when full and,
+    once fewer than 1/4 of the slots are in use, shrink to twice the number
+    of elements but never below 10 slots. min_capacity only bounds
+    shrinking: new arrays still start with 4 slots. Subclasses may override grow() and shrink()
+    to plug in a different policy
+    """
+
+    def __init__(self, growth_factor: float = 2, shrink_threshold: float = 0.25,
+                 min_capacity: int = 10):
+        """
+        Initialize new growth policy
+        shrink_threshold * growth_factor must stay below 1, so that a shrunk
+        array is back above the threshold instead of shrinking on every
+        removal
+        """
+        if growth_factor <= 1 or not 0 <= shrink_threshold < 1 or min_capacity < 1:
+            raise DynamicArrayException
+        if shrink_threshold * growth_factor >= 1:
+            raise DynamicArrayException
+        self.growth_factor = growth_factor
+        self.shrink_threshold = shrink_threshold
+        self.min_capacity = min_capacity
+
+    def grow(self, capacity: int, needed: int) -> int:
+        """
+        Return the capacity to grow to so that at least needed elements fit
+        """
+        while capacity < needed:
+            capacity = max(capacity + 1, int(capacity * self.growth_factor))
+        return capacity
+
+    def shrink(self, capacity: int, size: int) -> int:
+        """
+        Return the capacity to shrink to for an array holding size elements,
+        or capacity itself if the array should keep its storage
+        """
+        if capacity > self.min_capacity:
+            if size < int(capacity * self.shrink_threshold):
+                return max(int(size * self.growth_factor), self.min_capacity)
+        return capacity
+
+
+DEFAULT_GROWTH_POLICY = GrowthPolicy()
+
+
+class _RingStorage:
+    """
+    Fixed-capacity storage addressed by logical index relative to a movable
+    head, used by circular DynamicArrays
+    """
+
+    def __init__(self, storage, capacity: int):
+        self._storage = storage
+        self._capacity = capacity
+        self._head = 0
+
+    def __str__(self) -> str:
+        return f"RING Head: {self._head} {self._storage}"
+
+    def __getitem__(self, index: int) -> object:
+        return self._storage[(self._head + index) % self._capacity]
+
+    def __setitem__(self, index: int, value: object) -> None:
+        self._storage[(self._head + index) % self._capacity] = value
+
+    def head(self) -> int:
+        """
+        Return the slot holding logical index 0
+        """
+        return self._head
+
+    def move_head(self, offset: int) -> None:
+        """
+        Shift logical index 0 by offset slots around the ring
+        """
+        self._head = (self._head + offset) % self._capacity
+
+
+class _WindowStorage:
+    """
+    Storage for a DynamicArrayView, mapping view indices onto a range of the
+    parent array's storage
+    Accesses raise DynamicArrayException once the parent has been resized,
+    has shrunk below the end of the window, has moved its first element
+    (appendleft()/popleft() on a circular array) or has been cleared
+    """
+
+    def __init__(self, parent, start: int, size: int):
+        self._parent = parent
+        self._storage = parent._data
+        self._version = parent._version
+        self._start = start
+        self._end = start + size
+
+    def __str__(self) -> str:
+        return f"WINDOW [{self._start}:{self._end}] {self._storage}"
+
+    def __getitem__(self, index: int) -> object:
+        parent = self._parent
+        if (parent._data is not self._storage or parent._version != self._version
+                or parent._size < self._end):
+            raise DynamicArrayException
+        return self._storage[self._start + index]
+
+    def __setitem__(self, index: int, value: object) -> None:
+        parent = self._parent
+        if (parent._data is not self._storage or parent._version != self._version
+                or parent._size < self._end):
+            raise DynamicArrayException
+        self._storage[self._start + index] = value
+
+    def is_valid(self) -> bool:
+        """
+        Return True if the window still refers to the parent's elements
+        """
+        return (self._parent._data is self._storage
+                and self._parent._version == self._version
+                and self._parent._size >= self._end)
+
+    def block_source(self) -> tuple:
+        """
+        Return the storage underneath the window (and any windows it is
+        built on) with the index of the window's first element in it
+        """
+        if not self.is_valid():
+            raise DynamicArrayException
+        if isinstance(self._storage, _WindowStorage):
+            storage, start = self._storage.block_source()
+            return storage, start + self._start
+        return self._storage, self._start
+
+
+def _copy_block(source, source_start: int, target, target_start: int,
+                count: int) -> None:
+    """
+    Copy count elements from source storage to target storage
+    Typed storages (arrays or memoryviews) with the same typecode are
+    copied as one C-level block;
+    other storages fall back to an element by element loop. Overlapping
+    ranges within one storage are copied like memmove
+    """
+    if count <= 0:
+        return
+    source_format = _block_format(source)
+    if source_format is not None and source_format == _block_format(target):
+        memoryview(target)[target_start:target_start + count] = \
+            memoryview(source)[source_start:source_start + count]
+    elif source is target and source_start < target_start:
+        # shifting right, copy from the back so nothing is overwritten
+        for offset in range(count - 1, -1, -1):
+            target[target_start + offset] = source[source_start + offset]
+    else:
+        for offset in range(count):
+            target[target_start + offset] = source[source_start + offset]
+
+
+def _is_ufunc(func, *typecodes) -> bool:
+    """
+    Return True if func is a NumPy ufunc and every typecode has a NumPy dtype
+    """
+    if numpy is None or not isinstance(func, numpy.ufunc):
+        return False
+    for typecode in typecodes:
+        if typecode not in _NUMERIC_TYPECODES:
+            return False
+    return True
+
+
+def _block_format(storage) -> str:
+    """
+    Return the typecode of array module or memoryview storage, or None for
+    storage that cannot be block copied
+    """
+    if isinstance(storage, array):
+        return storage.typecode
+    if isinstance(storage, memoryview):
+        return storage.format
+    return None
+
+
+class _ArrayStats:
+    """
+    Opt-in counters of a DynamicArray: resizes, bytes copied by resizes and
+    element shifts, and the capacity high-water mark
+    Object-mode arrays count one pointer per element copied
+    """
+
+    def __init__(self, capacity: int = 0, callback=None, interval: int = 1):
+        """
+        Initialize zeroed counters; callback(stats dict) is called after
+        every interval recorded events
+        """
+        self.resizes = 0
+        self.bytes_copied = 0
+        self.capacity_high_water = capacity
+        self._callback = callback
+        self._interval = interval
+        self._events = 0
+
+    def as_dict(self) -> dict:
+        """
+        Return the counters as a dict
+        """
+        return {"resizes": self.resizes, "bytes_copied": self.bytes_copied,
+                "capacity_high_water": self.capacity_high_water}
+
+    def record_resize(self, capacity: int, copied: int) -> None:
+        """
+        Record a resize to capacity that copied copied bytes
+        """
+        self.resizes += 1
+        if capacity > self.capacity_high_water:
+            self.capacity_high_water = capacity
+        self.record_copy(copied)
+
+    def record_copy(self, copied: int) -> None:
+        """
+        Record copied bytes moved within or between storages
+        """
+        self.bytes_copied += copied
+        self._events += 1
+        if self._callback is not None and self._events % self._interval == 0:
+            self._callback(self.as_dict())
+
+
 class DynamicArray:
-    def __init__(self, start_array=None):
+    def __init__(self, start_array=None, typecode=None, policy=None,
+                 circular=False, path=None):
         """
         Initialize new dynamic array
-        DO NOT CHANGE THIS METHOD IN ANY WAY
+        If a typecode from the array module is given (e.g. 'q' or 'd'), elements
+        are stored unboxed in a contiguous machine-typed buffer instead of a
+        StaticArray of Python objects
+        policy is the GrowthPolicy deciding how capacity grows and shrinks
+        A circular array keeps its elements in a ring buffer so appendleft()
+        and popleft() also run in O(1)
+        With a path, typed elements live in a new memory-mapped file there
+        (see attach() and flush()); resizing grows the file. An existing file
+        raises DynamicArrayException, use attach(path, readonly=False) to
+        resume writing to it
         """
+        if typecode is not None:
+            try:
+                array(typecode)
+            except (TypeError, ValueError):
+                raise DynamicArrayException
+        if path is not None and (typecode is None or circular):
+            raise DynamicArrayException
         self._size = 0
         self._capacity = 4
-        self._data = StaticArray(self._capacity)
+        self._typecode = typecode
+        self._policy = DEFAULT_GROWTH_POLICY if policy is None else policy
+        self._circular = circular
+        self._stats = None
+        self._readonly = False
+        self._version = 0       # bumped when existing elements change index
+        self._file = None if path is None else _MappedFile(path, typecode, create=True)
+        self._data = self._new_storage(self._capacity)
 
         # populate dynamic array with initial values (if provided)
-        # before using this feature, implement append() method
         if start_array is not None:
-            for value in start_array:
-                self.append(value)
+            self.extend(start_array)
 
     def __str__(self) -> str:
         """
@@ -46,23 +321,38 @@ class DynamicArray:
     def __iter__(self):
         """
         Create iterator for loop
-        DO NOT CHANGE THIS METHOD IN ANY WAY
+        Each call returns an independent iterator, so nested and concurrent
+        loops over the same array do not interfere
         """
-        self._index = 0
-        return self
+        index = 0
+        while index < self._size:
+            yield self._data[index]
+            index += 1
 
-    def __next__(self):
+    def __reversed__(self):
         """
-        Obtain next value and advance iterator
-        DO NOT CHANGE THIS METHOD IN ANY WAY
+        Create iterator over the elements from last to first
         """
-        try:
-            value = self[self._index]
-        except DynamicArrayException:
-            raise StopIteration
+        index = self._size - 1
+        while index >= 0:
+            if index < self._size:
+                yield self._data[index]
+            index -= 1
 
-        self._index += 1
-        return value
+    def iter_chunks(self, chunk_size: int):
+        """
+        Create iterator over consecutive views of up to chunk_size elements
+        The chunks share this array's storage (see view()) and become invalid
+        if the array is resized while they are in use
+        Raise DynamicArrayException if chunk_size is not positive
+        """
+        if chunk_size <= 0:
+            raise DynamicArrayException
+        start = 0
+        while start < self._size:
+            size = min(chunk_size, self._size - start)
+            yield DynamicArrayView(self, start, size)
+            start += size
 
     def get_at_index(self, index: int) -> object:
         """
@@ -129,6 +419,102 @@ class DynamicArray:
         """
         print(f"Length: {self._size}, Capacity: {self._capacity}, {self._data}")
 
+    def __buffer__(self, flags: int) -> memoryview:
+        """
+        Expose the stored elements of a typed array through the buffer protocol
+        (Python 3.12+; older versions ignore this method, use get_buffer())
+        Object mode arrays have no machine-typed buffer and raise TypeError
+        """
+        return self.get_buffer()
+
+    def get_typecode(self) -> str:
+        """
+        Return the array module typecode of the storage, or None in object mode
+        """
+        return self._typecode
+
+    def get_buffer(self) -> memoryview:
+        """
+        Return a memoryview over the stored elements of a typed array
+        The view refers to the current storage and goes stale after a resize
+        A circular array is only reallocated when its elements wrap around
+        """
+        if self._typecode is None:
+            raise TypeError("object mode DynamicArray does not expose a buffer")
+        if self._circular:
+            head = self._data.head()
+            if head + self._size > self._capacity:
+                # the elements wrap around, unroll the ring to the first slot
+                self.resize(self._capacity)
+                head = 0
+            return memoryview(self._data._storage)[head:head + self._size]
+        return memoryview(self._data)[:self._size]
+
+    def get_storage(self) -> object:
+        """
+        Return the underlying storage for unchecked element access
+        Only indices 0 to length() - 1 hold elements of the array, and the
+        reference goes stale after the array is resized
+        """
+        return self._data
+
+    def is_circular(self) -> bool:
+        """
+        Return True if the array is stored as a ring buffer
+        """
+        return self._circular
+
+    def enable_stats(self, callback=None, interval: int = 1, stats=None) -> None:
+        """
+        Start counting resizes, bytes copied and the capacity high-water mark
+        callback, if given, receives the stats() dict after every interval
+        resizes or element shifts
+        stats continues an existing set of counters instead of starting new
+        ones, so a MinHeap can keep one set across the arrays it replaces
+        While disabled the counters cost one None check per resize or shift
+        """
+        if stats is None:
+            stats = _ArrayStats(self._capacity, callback, interval)
+        self._stats = stats
+
+    def disable_stats(self) -> None:
+        """
+        Stop counting and drop the counters
+        """
+        self._stats = None
+
+    def stats(self) -> dict:
+        """
+        Return a dict of the counters, or None while instrumentation is
+        disabled
+        """
+        if self._stats is None:
+            return None
+        return self._stats.as_dict()
+
+    def _item_size(self) -> int:
+        """
+        Return the number of bytes one element occupies in the storage
+        """
+        if self._typecode is None:
+            return _POINTER_SIZE
+        return array(self._typecode).itemsize
+
+    def _new_storage(self, capacity: int) -> object:
+        """
+        Allocate backing storage for the given capacity
+        File-backed arrays map the file instead, growing it if needed
+        """
+        if self._file is not None:
+            return self._file.map(capacity)
+        if self._typecode is None:
+            storage = StaticArray(capacity)
+        else:
+            storage = array(self._typecode, bytes(capacity * array(self._typecode).itemsize))
+        if self._circular:
+            return _RingStorage(storage, capacity)
+        return storage
+
     # -----------------------------------------------------------------------
 
     def resize(self, new_capacity: int) -> None:
@@ -136,44 +522,174 @@ class DynamicArray:
         Change the storage capacity of the array to the positive integers
         given for new_capacity
         """
+        if self._readonly:
+            raise DynamicArrayException
         if new_capacity > 0 and new_capacity >= self._size:
             self._capacity = new_capacity 
 
             # Create a empty array   
-            temp = StaticArray(self._capacity)
-
-            # loop through the old array
-                # copy value of each element to the new array
-            for index in range(self._size):
-                temp[index] = self._data[index]
+            temp = self._new_storage(self._capacity)
+
+            # copy the elements to the new array in one block; a remapped
+            # file already holds them
+            copied = 0
+            if self._file is None:
+                _copy_block(self._data, 0, temp, 0, self._size)
+                copied = self._size * self._item_size()
             # Update the array
             self._data = temp
+            if self._stats is not None:
+                self._stats.record_resize(new_capacity, copied)
 
     def append(self, value: object) -> None:
         """
-        Add a value to the end of the array and double capacity if full
+        Add a value to the end of the array and grow capacity if full
         """
+        if self._readonly:
+            raise DynamicArrayException
         if self._size == self._capacity:
-            self.resize(self._capacity * 2)
+            self.resize(self._policy.grow(self._capacity, self._size + 1))
         self._data[self._size] = value
         self._size += 1
 
+    def pop(self) -> object:
+        """
+        Remove and return the last value of the array in O(1) amortized
+        Raise DynamicArrayException if the array is empty
+        Capacity is reduced according to the growth policy
+        """
+        if self._readonly:
+            raise DynamicArrayException
+        if self._size == 0:
+            raise DynamicArrayException
+
+        new_capacity = self._policy.shrink(self._capacity, self._size)
+        if new_capacity != self._capacity:
+            self.resize(new_capacity)
+
+        self._size -= 1
+        value = self._data[self._size]
+        if self._typecode is None:
+            # drop the reference so the object can be freed
+            self._data[self._size] = None
+        return value
+
+    def appendleft(self, value: object) -> None:
+        """
+        Add a value to the start of the array
+        O(1) amortized for circular arrays and O(N) otherwise
+        """
+        if self._readonly:
+            raise DynamicArrayException
+        if not self._circular:
+            self.insert_at_index(0, value)
+            return
+        if self._size == self._capacity:
+            self.resize(self._policy.grow(self._capacity, self._size + 1))
+        self._data.move_head(-1)
+        self._version += 1
+        self._data[0] = value
+        self._size += 1
+
+    def popleft(self) -> object:
+        """
+        Remove and return the first value of the array
+        O(1) amortized for circular arrays and O(N) otherwise
+        Raise DynamicArrayException if the array is empty
+        """
+        if self._readonly:
+            raise DynamicArrayException
+        if self._size == 0:
+            raise DynamicArrayException
+        if not self._circular:
+            value = self._data[0]
+            self.remove_at_index(0)
+            return value
+
+        new_capacity = self._policy.shrink(self._capacity, self._size)
+        if new_capacity != self._capacity:
+            self.resize(new_capacity)
+
+        value = self._data[0]
+        if self._typecode is None:
+            self._data[0] = None
+        self._data.move_head(1)
+        self._version += 1
+        self._size -= 1
+        return value
+
+    def reserve(self, capacity: int) -> None:
+        """
+        Grow the storage so at least capacity elements fit without resizing
+        """
+        if capacity > self._capacity:
+            self.resize(capacity)
+
+    def shrink_to_fit(self) -> None:
+        """
+        Reduce the storage to exactly the number of elements stored
+        """
+        self.resize(max(self._size, 1))
+
+    def extend(self, values) -> None:
+        """
+        Add every value from values to the end of the array in one pass
+        When the number of values is known up front, capacity is grown to
+        fit all of them with a single resize
+        """
+        if self._readonly:
+            raise DynamicArrayException
+        if isinstance(values, DynamicArray):
+            count = values.length()
+        else:
+            try:
+                count = len(values)
+            except TypeError:
+                # unsized iterable, grow as we go
+                for value in values:
+                    self.append(value)
+                return
+
+        # take hold of the source storage before resizing, which would
+        # invalidate a view of this array
+        if isinstance(values, DynamicArray):
+            source = values.get_storage()
+            source_start = 0
+            if isinstance(source, _WindowStorage):
+                source, source_start = source.block_source()
+
+        if self._size + count > self._capacity:
+            self.resize(self._policy.grow(self._capacity, self._size + count))
+
+        data = self._data
+        index = self._size
+        if isinstance(values, DynamicArray):
+            _copy_block(source, source_start, data, index, count)
+            index += count
+        else:
+            for value in values:
+                data[index] = value
+                index += 1
+        self._size = index
+
     def insert_at_index(self, index: int, value: object) -> None:
         """
         Add a new value at specified index and index 0 refers to the start of array
         Raise a DynamicArrayException if the index is not valid 
-        Resize array to double capacity if array is full 
+        Grow array capacity according to the growth policy if array is full 
         """
+        if self._readonly:
+            raise DynamicArrayException
         if index < 0 or index > self._size:
             raise DynamicArrayException
         if self._capacity == self._size:
-            self.resize(self._capacity * 2)
+            self.resize(self._policy.grow(self._capacity, self._size + 1))
         
-        # shift existing elements
-        # i for iteration
-        for i in range(self._size, index, -1):
-            self._data[i] = self._data[i-1]
-    
+        # shift existing elements right by one in one block
+        _copy_block(self._data, index, self._data, index + 1, self._size - index)
+        if self._stats is not None:
+            self._stats.record_copy((self._size - index) * self._item_size())
+
          # insert value into index
         self._data[index] = value 
         self._size += 1
@@ -183,25 +699,25 @@ class DynamicArray:
         Remove a value at specified index and index 0 refers to the start of array
         Raise DynamicArrayException if the index is not valid 
 
-        Resize array to be reduced to twice the number of elements stored 
-        if number of elements is less than 1/4 capacity
+        Capacity is reduced according to the growth policy, which by default
+        shrinks to twice the number of elements stored if number of elements
+        is less than 1/4 capacity
         If capacity is less than 10, reduction will not occur, but if greater than 10, 
         the capacity cannot be less than 10.
         """
+        if self._readonly:
+            raise DynamicArrayException
         if index < 0 or index > self._size - 1:
             raise DynamicArrayException
         
-        if self._capacity > 10:
-            if self._size < self._capacity // 4:
-                if self._size * 2 >= 10:
-                    self.resize(self._size * 2)
-                else:
-                    self.resize(10)
-
-        # shift elements from the back, overwrite index 
-        # i for iteration
-        for i in range(index + 1, self._size):
-            self._data[i - 1] = self._data[i]
+        new_capacity = self._policy.shrink(self._capacity, self._size)
+        if new_capacity != self._capacity:
+            self.resize(new_capacity)
+
+        # shift elements from the back left by one in one block, overwrite index 
+        _copy_block(self._data, index + 1, self._data, index, self._size - index - 1)
+        if self._stats is not None:
+            self._stats.record_copy((self._size - index - 1) * self._item_size())
         self._size -= 1
 
     def slice(self, start_index: int, size: int) -> "DynamicArray":
@@ -219,25 +735,171 @@ class DynamicArray:
         if size > self._size - start_index:
             raise DynamicArrayException
         
-        slice_arr = DynamicArray()
+        slice_arr = DynamicArray(typecode=self._typecode, policy=self._policy,
+                                 circular=self._circular)
         
-        for index in range(start_index, start_index + size):
-            slice_arr.append(self._data[index])
+        # pre-size the new array and copy the elements in one block
+        slice_arr.reserve(self._policy.grow(slice_arr.get_capacity(), size))
+        _copy_block(self._data, start_index, slice_arr._data, 0, size)
+        slice_arr._size = size
         return slice_arr
 
+    def save(self, path: str) -> None:
+        """
+        Write the elements to a binary snapshot file at path
+        Typed arrays are written as a fixed-width block of their machine
+        values, object mode arrays as a pickle stream
+        Raises DynamicArrayException if path is the array's own backing file
+        """
+        _write_snapshot(path, self)
+
+    @staticmethod
+    def load(path: str, mmap: bool = True) -> "DynamicArray":
+        """
+        Return a new DynamicArray read from a snapshot written by save()
+        With mmap=True a typed snapshot is mapped copy-on-write instead of
+        read, so loading is O(1) and pages are read on first access;
+        changes never reach the file. Raises DynamicArrayException if path
+        is not a valid snapshot
+        """
+        return _read_snapshot(path, mmap)[0]
+
+    @staticmethod
+    def attach(path: str, readonly: bool = True) -> "DynamicArray":
+        """
+        Return a file-backed DynamicArray mapped onto the file at path,
+        created with DynamicArray(path=...) or save(), without copying it
+        It holds the elements published by the last flush(); readers call
+        refresh() to see later ones. Any number of processes can attach
+        read-only, where every change raises DynamicArrayException except
+        element stores (set_at_index(), array[i] = v and writes to
+        get_storage()), which raise TypeError. readonly=False
+        resumes writing to the file. close() releases the mapping
+        """
+        return _attach_file(path, readonly)[0]
+
+    def is_readonly(self) -> bool:
+        """
+        Return True if the array is attached read-only to a file
+        """
+        return self._readonly
+
+    def get_path(self) -> str:
+        """
+        Return the path of the file backing the array, or None
+        """
+        if self._file is None:
+            return None
+        return self._file.path
+
+    def flush(self, kind: int = None, arity: int = None, count: int = None) -> None:
+        """
+        Publish the current length in the file header for attached readers
+        and write the mapped elements to disk
+        kind, arity and count are the snapshot header fields MinHeap stores;
+        None keeps the values already in the file
+        Raises DynamicArrayException if the array is not file-backed
+        """
+        if self._file is None or self._file.readonly:
+            raise DynamicArrayException
+        self._file.publish(self._size, kind, arity, count)
+
+    def refresh(self) -> None:
+        """
+        Re-read the length published by the writer's last flush(), mapping
+        any part of the file that has grown since
+        Raises DynamicArrayException unless the array is attached read-only,
+        since a writer would drop everything added since its last flush()
+        """
+        if self._file is None or not self._readonly:
+            raise DynamicArrayException
+        size = self._file.read_header()[1]
+        capacity = self._file.capacity()
+        if capacity != self._capacity:
+            self._capacity = capacity
+            self._data = self._file.map(capacity)
+        self._size = size
+
+    def clear(self) -> None:
+        """
+        Remove every element, keeping the current storage
+        """
+        if self._readonly:
+            raise DynamicArrayException
+        if self._typecode is None:
+            for index in range(self._size):
+                self._data[index] = None
+        self._size = 0
+        self._version += 1
+
+    def close(self) -> None:
+        """
+        Release the mapping and file of a file-backed array, publishing its
+        length first unless it is read-only; the array is empty afterwards
+        Does nothing for arrays kept in memory
+        """
+        if self._file is None:
+            return
+        if not self._file.readonly:
+            self._file.publish(self._size)
+        self._file.close(self._data)
+        self._file = None
+        self._readonly = False
+        self._size = 0
+        self._capacity = 4
+        self._data = self._new_storage(self._capacity)
+
+    def view(self, start_index: int, size: int) -> "DynamicArrayView":
+        """
+        Return a fixed-size window onto the requested elements that shares
+        this array's storage instead of copying it
+        Raise DynamicArrayException if the index is not valid
+        """
+        # same validity rules as slice()
+        if size < 0:
+            raise DynamicArrayException
+        if start_index < 0 or start_index > self._size - 1:
+            raise DynamicArrayException
+        if size > self._size - start_index:
+            raise DynamicArrayException
+        return DynamicArrayView(self, start_index, size)
+
     def merge(self, second_da: "DynamicArray") -> None:
         """
         Appends elements from one array to the end of another in the same order 
+        Capacity is grown once and the elements are copied in one block
         """
-        for index in range(second_da.length()):
-            self.append(second_da[index])
+        self.extend(second_da)
 
-    def map(self, map_func) -> "DynamicArray":
+    def map(self, map_func, typecode=None) -> "DynamicArray":
         """
         Return a new dynamic array with corresponding values that result from 
         taking in a map_func as an argument
+        With a typecode the result is a typed array; if this array is typed as
+        well, the values are produced in one pass into pre-allocated storage
+        (a NumPy ufunc is applied to the whole buffer when NumPy is installed,
+        and results outside the typecode's range wrap as NumPy casts them)
         """
-        map_arr = DynamicArray()
+        source = self._vector_source()
+        if typecode is not None and source is not None and len(source) > 0:
+            if _is_ufunc(map_func, source.format, typecode):
+                # write the ufunc output straight into pre-allocated storage
+                map_arr = DynamicArray(typecode=typecode, policy=self._policy)
+                map_arr.reserve(len(source))
+                map_arr._size = len(source)
+                map_func(numpy.frombuffer(source, dtype=source.format),
+                         out=numpy.frombuffer(map_arr.get_buffer(), dtype=typecode),
+                         casting="unsafe")
+                return map_arr
+            # fill pre-allocated storage instead of growing it value by value
+            storage = array(typecode, bytes(len(source) * array(typecode).itemsize))
+            index = 0
+            for value in builtins.map(map_func, source):
+                storage[index] = value
+                index += 1
+            return self._typed_result(typecode, storage)
+
+        map_arr = DynamicArray(typecode=typecode)
         for index in range(self._size):
             map_arr.append(map_func(self._data[index]))
         return map_arr
@@ -246,8 +908,20 @@ class DynamicArray:
         """
         Return a new dynamic array with corresponding values that return True after 
         applying filter_func as an argument to input array
+        Typed arrays are filtered in one vectorized pass
         """
-        filter_arr = DynamicArray()
+        source = self._vector_source()
+        if source is not None and len(source) > 0:
+            if _is_ufunc(filter_func, source.format):
+                values = numpy.frombuffer(source, dtype=source.format)
+                kept = values[filter_func(values) == True]
+                return self._typed_result(self._typecode, array(self._typecode, kept.tobytes()))
+            # keep values whose filter result == True, as the loop below does
+            flags = builtins.map(operator.eq, builtins.map(filter_func, source), repeat(True))
+            return self._typed_result(self._typecode, array(self._typecode, compress(source, flags)))
+
+        filter_arr = DynamicArray(typecode=self._typecode, policy=self._policy,
+                                  circular=self._circular)
         for index in range(self._size):
             filtered_item = self._data[index]
             if filter_func(filtered_item) == True:
@@ -260,9 +934,22 @@ class DynamicArray:
         The optionally provided initializer will be established as the first value of the array
 
         An empty array will return the value of the initializer if provided or None otherwise
+        Typed arrays are reduced in one vectorized pass, using ufunc.reduce for
+        NumPy ufuncs
         """
         if self.is_empty():
             return initializer
+        source = self._vector_source()
+        if source is not None:
+            if _is_ufunc(reduce_func, source.format):
+                values = numpy.frombuffer(source, dtype=source.format)
+                if initializer == None:
+                    return reduce_func.reduce(values).item()
+                return reduce_func.reduce(values, initial=initializer).item()
+            if initializer == None:
+                return functools.reduce(reduce_func, source)
+            return functools.reduce(reduce_func, source, initializer)
+
         if initializer == None:
             result = self._data[0]
             for index in range(self._size - 1):
@@ -273,34 +960,440 @@ class DynamicArray:
                 result = reduce_func(result, self._data[index])
         return result
 
+    def _vector_source(self) -> memoryview:
+        """
+        Helper method to return a memoryview over the elements for the
+        vectorized map/filter/reduce paths, or None if the array has no
+        contiguous typed buffer
+        """
+        if self._typecode is None or self._typecode not in _NUMERIC_TYPECODES \
+                or self._circular:
+            return None
+        try:
+            return self.get_buffer()
+        except TypeError:
+            return None
+
+    def _typed_result(self, typecode: str, storage: array) -> "DynamicArray":
+        """
+        Helper method to wrap a filled array module storage in a new typed
+        dynamic array without copying it
+        """
+        result = DynamicArray(typecode=typecode, policy=self._policy)
+        if len(storage) > 0:
+            result._data = storage
+            result._capacity = len(storage)
+            result._size = len(storage)
+        return result
+
+
+class DynamicArrayView(DynamicArray):
+    """
+    Fixed-size window onto a range of a DynamicArray, returned by view()
+    Indexing, iteration, map/filter/reduce, slice, heapsort and build_heap
+    read and write the parent's elements directly. A view cannot change
+    size, and once the parent is resized or shrinks below the end of the
+    window every access raises DynamicArrayException
+    """
+
+    def __init__(self, parent: DynamicArray, start_index: int, size: int):
+        """
+        Initialize new view of size elements of parent from start_index
+        """
+        self._size = size
+        self._capacity = size
+        self._typecode = parent.get_typecode()
+        self._policy = parent._policy
+        self._circular = False
+        self._stats = None
+        self._readonly = parent._readonly
+        self._version = 0
+        self._file = None
+        self._parent = parent
+        self._start = start_index
+        self._data = _WindowStorage(parent, start_index, size)
+
+    def is_valid(self) -> bool:
+        """
+        Return True if the view still refers to the parent's elements
+        """
+        return self._data.is_valid()
+
+    def get_buffer(self) -> memoryview:
+        """
+        Return a memoryview over the elements of a view of a typed array
+        """
+        if not self._data.is_valid():
+            raise DynamicArrayException
+        if self._parent.is_circular():
+            raise TypeError("views of circular arrays do not expose a buffer")
+        return self._parent.get_buffer()[self._start:self._start + self._size]
+
+    def resize(self, new_capacity: int) -> None:
+        """
+        Views have a fixed size and raise DynamicArrayException
+        """
+        raise DynamicArrayException
+
+    def pop(self) -> object:
+        """
+        Views have a fixed size and raise DynamicArrayException
+        """
+        raise DynamicArrayException
 
-def find_mode(arr: DynamicArray) -> tuple[DynamicArray, int]:
+    def remove_at_index(self, index: int) -> None:
+        """
+        Views have a fixed size and raise DynamicArrayException
+        """
+        raise DynamicArrayException
+
+    def clear(self) -> None:
+        """
+        Views have a fixed size and raise DynamicArrayException
+        """
+        raise DynamicArrayException
+
+
+def _write_snapshot(path: str, da: DynamicArray, kind: int = 0,
+                    arity: int = 0, count: int = 0) -> None:
+    """
+    Helper function to write da with a snapshot header to path
+    The file is written next to path and renamed into place, so a crash
+    never leaves a partial snapshot behind
+    """
+    # replacing the backing file would leave the array writing to an
+    # unlinked file that attached readers never see
+    backing = da.get_path()
+    if (backing is not None and os.path.exists(path)
+            and os.path.samefile(path, backing)):
+        raise DynamicArrayException
+    typecode = da.get_typecode()
+    temp_path = path + ".tmp"
+    with open(temp_path, "wb") as snapshot:
+        snapshot.write(_SNAPSHOT_HEADER.pack(
+            _SNAPSHOT_MAGIC, (typecode or "\x00").encode(),
+            b"<" if sys.byteorder == "little" else b">",
+            kind, da.length(), arity, count))
+        if typecode is not None:
+            snapshot.write(da.get_buffer())
+        else:
+            pickler = pickle.Pickler(snapshot, pickle.HIGHEST_PROTOCOL)
+            for value in da:
+                pickler.dump(value)
+                pickler.clear_memo()
+    os.replace(temp_path, path)
+
+
+def _read_snapshot(path: str, use_mmap: bool) -> tuple:
+    """
+    Helper function to read a snapshot file and return a tuple of the
+    DynamicArray and the kind, arity and count header fields
+    """
+    with open(path, "rb") as snapshot:
+        header = snapshot.read(_SNAPSHOT_HEADER.size)
+        if len(header) != _SNAPSHOT_HEADER.size:
+            raise DynamicArrayException
+        magic, code, order, kind, size, arity, count = _SNAPSHOT_HEADER.unpack(header)
+        if magic != _SNAPSHOT_MAGIC or size < 0:
+            raise DynamicArrayException
+
+        if code == b"\x00":
+            da = DynamicArray()
+            da.reserve(size)
+            unpickler = pickle.Unpickler(snapshot)
+            try:
+                for _ in range(size):
+                    da.append(unpickler.load())
+            except (EOFError, pickle.UnpicklingError):
+                raise DynamicArrayException
+            return da, kind, arity, count
+
+        typecode = code.decode("latin-1")
+        da = DynamicArray(typecode=typecode)
+        nbytes = size * array(typecode).itemsize
+        # file-backed arrays leave spare capacity after the elements
+        if os.fstat(snapshot.fileno()).st_size < _SNAPSHOT_HEADER.size + nbytes:
+            raise DynamicArrayException
+        native = order == (b"<" if sys.byteorder == "little" else b">")
+
+        storage = None
+        if use_mmap and native and size > 0:
+            mapping = mmap.mmap(snapshot.fileno(), 0, access=mmap.ACCESS_COPY)
+            try:
+                storage = memoryview(mapping)[
+                    _SNAPSHOT_HEADER.size:_SNAPSHOT_HEADER.size + nbytes].cast(typecode)
+            except (TypeError, ValueError):
+                pass    # typecode has no memoryview format, read instead
+        if storage is None:
+            storage = array(typecode)
+            storage.frombytes(snapshot.read(nbytes))
+            if not native:
+                storage.byteswap()
+        if size > 0:
+            da._data = storage
+            da._capacity = size
+            da._size = size
+        return da, kind, arity, count
+
+
+def _attach_file(path: str, readonly: bool) -> tuple:
+    """
+    Helper function to map an existing snapshot file as file-backed storage
+    and return a tuple of the DynamicArray and the kind, arity and count
+    header fields
+    """
+    typecode = _MappedFile.read_typecode(path)
+    if typecode is None:
+        raise DynamicArrayException
+    mapped = _MappedFile(path, typecode, readonly)
+    kind, size, arity, count = mapped.read_header()
+    da = DynamicArray(typecode=typecode)
+    da._capacity = mapped.capacity()
+    da._file = mapped
+    da._readonly = readonly
+    da._data = mapped.map(da._capacity)
+    da._size = size
+    return da, kind, arity, count
+
+
+class _MappedFile:
+    """
+    Snapshot file whose element region is memory-mapped as the storage of a
+    file-backed DynamicArray
+    The header's size field is only updated by publish(). The file never
+    shrinks, so processes that have it mapped are never cut off
+    """
+
+    def __init__(self, path: str, typecode: str, readonly: bool = False,
+                 create: bool = False):
+        """
+        Open (or with create=True, create) the file at path
+        An existing file is never created over, since truncating it would cut
+        off processes that have it mapped; it raises DynamicArrayException
+        """
+        self.path = path
+        self.readonly = readonly
+        self._typecode = typecode
+        self._itemsize = array(typecode).itemsize
+        self._mapping = None
+        try:
+            memoryview(b"").cast(typecode)
+        except (TypeError, ValueError):
+            raise DynamicArrayException     # no fixed-width memoryview format
+        # unbuffered, so header reads always see the writer's latest publish()
+        mode = "x+b" if create else ("rb" if readonly else "r+b")
+        try:
+            self._file = open(path, mode, buffering=0)
+        except FileExistsError:
+            raise DynamicArrayException
+        if create:
+            self.publish(0)
+
+    @staticmethod
+    def read_typecode(path: str) -> str:
+        """
+        Return the typecode stored in the header of the snapshot at path,
+        or None for an object mode snapshot
+        """
+        with open(path, "rb") as snapshot:
+            header = snapshot.read(_SNAPSHOT_HEADER.size)
+        if len(header) != _SNAPSHOT_HEADER.size:
+            raise DynamicArrayException
+        magic, code = _SNAPSHOT_HEADER.unpack(header)[:2]
+        if magic != _SNAPSHOT_MAGIC:
+            raise DynamicArrayException
+        return None if code == b"\x00" else code.decode("latin-1")
+
+    def capacity(self) -> int:
+        """
+        Return the number of elements the file currently has room for
+        """
+        size = os.fstat(self._file.fileno()).st_size
+        return (size - _SNAPSHOT_HEADER.size) // self._itemsize
+
+    def map(self, capacity: int) -> memoryview:
+        """
+        Return a typed memoryview over the first capacity element slots,
+        growing the file first if it is too small
+        """
+        fileno = self._file.fileno()
+        needed = _SNAPSHOT_HEADER.size + capacity * self._itemsize
+        if os.fstat(fileno).st_size < needed:
+            if self.readonly:
+                raise DynamicArrayException
+            os.ftruncate(fileno, needed)
+        access = mmap.ACCESS_READ if self.readonly else mmap.ACCESS_WRITE
+        self._mapping = mmap.mmap(fileno, 0, access=access)
+        return memoryview(self._mapping)[_SNAPSHOT_HEADER.size:needed].cast(self._typecode)
+
+    def close(self, storage: memoryview) -> None:
+        """
+        Release storage, the current mapping and the file
+        A mapping still referenced by views held elsewhere is freed with them
+        """
+        storage.release()
+        if self._mapping is not None:
+            try:
+                self._mapping.close()
+            except BufferError:
+                pass
+            self._mapping = None
+        self._file.close()
+
+    def read_header(self) -> tuple:
+        """
+        Return the kind, size, arity and count fields of the header
+        """
+        self._file.seek(0)
+        header = _SNAPSHOT_HEADER.unpack(self._file.read(_SNAPSHOT_HEADER.size))
+        return header[3:]
+
+    def publish(self, size: int, kind: int = None, arity: int = None,
+                count: int = None) -> None:
+        """
+        Write the header with the given fields, keeping the stored kind,
+        arity and count where None, and flush mapped elements
+        """
+        stored = (0, 0, 0, 0)
+        if os.fstat(self._file.fileno()).st_size >= _SNAPSHOT_HEADER.size:
+            stored = self.read_header()
+        kind = stored[0] if kind is None else kind
+        arity = stored[2] if arity is None else arity
+        count = stored[3] if count is None else count
+        self._file.seek(0)
+        self._file.write(_SNAPSHOT_HEADER.pack(
+            _SNAPSHOT_MAGIC, self._typecode.encode(),
+            b"<" if sys.byteorder == "little" else b">",
+            kind, size, arity, count))
+        self._file.flush()
+        if self._mapping is not None:
+            self._mapping.flush()
+
+
+class _CountTable:
+    """
+    Open-addressing hash table counting occurrences of hashable objects
+    Slots are probed linearly from a multiplicative hash and a slot is free
+    while its count is 0. Distinct objects are remembered in order of first
+    appearance
+    """
+
+    def __init__(self, capacity: int = 16):
+        """
+        Initialize an empty table; capacity must be a power of two
+        """
+        self._size = 0
+        self._bits = max(capacity, 2).bit_length() - 1
+        self._keys = StaticArray(1 << self._bits)
+        self._counts = array('q', bytes(8 << self._bits))
+        self._order = DynamicArray(typecode='q')   # slots in first-appearance order
+
+    def length(self) -> int:
+        """
+        Return the number of distinct objects counted
+        """
+        return self._size
+
+    def add(self, value: object, count: int = 1) -> int:
+        """
+        Add count occurrences of value and return its new total
+        """
+        slot = self._find(value)
+        counts = self._counts
+        if counts[slot] == 0:
+            if 2 * (self._size + 1) > 1 << self._bits:
+                self._rehash()
+                slot = self._find(value)
+                counts = self._counts
+            self._keys[slot] = value
+            self._order.append(slot)
+            self._size += 1
+        counts[slot] += count
+        return counts[slot]
+
+    def get(self, value: object) -> int:
+        """
+        Return how many times value has been counted
+        """
+        return self._counts[self._find(value)]
+
+    def items(self):
+        """
+        Yield (object, count) pairs in order of first appearance
+        """
+        for slot in self._order:
+            yield self._keys[slot], self._counts[slot]
+
+    def _find(self, value: object) -> int:
+        """
+        Helper method to return the slot holding value, or the free slot
+        where it would be inserted
+        """
+        mask = (1 << self._bits) - 1
+        slot = ((hash(value) * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF) >> (64 - self._bits)
+        keys = self._keys
+        counts = self._counts
+        while counts[slot] != 0 and keys[slot] is not value and keys[slot] != value:
+            slot = (slot + 1) & mask
+        return slot
+
+    def _rehash(self) -> None:
+        """
+        Helper method to double the number of slots and re-insert every
+        object, keeping first-appearance order
+        """
+        keys = self._keys
+        counts = self._counts
+        order = self._order
+        self._bits += 1
+        self._keys = StaticArray(1 << self._bits)
+        self._counts = array('q', bytes(8 << self._bits))
+        self._order = DynamicArray(typecode='q')
+        for old_slot in order:
+            slot = self._find(keys[old_slot])
+            self._keys[slot] = keys[old_slot]
+            self._counts[slot] = counts[old_slot]
+            self._order.append(slot)
+
+
+def find_mode(arr, chunked: bool = False) -> tuple[DynamicArray, int]:
     """
     Finds the mode of input dynamic array and returns tuple of new dynamic 
     array containing the mode elements and frequency of elements
+    arr may be any iterable of hashable objects, or with chunked=True an
+    iterable of chunks (e.g. iter_chunks() views or lists). Equal objects
+    need not be adjacent: one O(N) pass counts them in a hash table, and
+    modes are returned in order of first appearance
     """
+    table = _count(arr, chunked)
     mode_arr = DynamicArray()
     frequency = 0
-    # initialize pointers i and j
-    i, j = 0,0
-    # for loop to iterate and find frequency 
-    while j < arr.length():
-        while  j < arr.length() and arr[i] == arr[j]:
-            j += 1
-        frequency = max(frequency, j - i)
-        i = j 
-    # return pointers i and j to index 0
-    i, j = 0,0
-    # for loop to append the correct highest mode element   
-    while j < arr.length():
-        while  j < arr.length() and arr[i] == arr[j]:
-            j+= 1
-        if frequency == j - i:
-            mode_arr.append(arr[i])
-        i = j 
+    for value, count in table.items():
+        if count > frequency:
+            frequency = count
+    for value, count in table.items():
+        if count == frequency:
+            mode_arr.append(value)
     return (mode_arr, frequency)
 
 
+def _count(values, chunked: bool = False) -> _CountTable:
+    """
+    Helper function to count the objects of an iterable, or of an iterable
+    of chunks, in a new _CountTable
+    """
+    table = _CountTable()
+    add = table.add
+    if chunked:
+        for chunk in values:
+            for value in chunk:
+                add(value)
+    else:
+        for value in values:
+            add(value)
+    return table
+
+
 # ------------------- BASIC TESTING -----------------------------------------
 
 
@@ -556,3 +1649,151 @@ if __name__ == "__main__":
         da.append(case[x])
         mode, frequency = find_mode(da)
         print(f"{da}\nMode: {mode}, Frequency: {frequency}")
+
+    import tempfile
+    snapshot_dir = tempfile.TemporaryDirectory()
+    snapshot = snapshot_dir.name + "/da.snap"
+
+    print("\n# save / load - example 1")
+    da = DynamicArray([5, -3, 8, 1], typecode='q')
+    da.save(snapshot)
+    for use_mmap in (True, False):
+        loaded = DynamicArray.load(snapshot, mmap=use_mmap)
+        print(loaded, loaded.get_typecode())
+    loaded = DynamicArray.load(snapshot)
+    loaded[0] = 100
+    loaded.append(9)
+    print(loaded)
+    print(DynamicArray.load(snapshot))
+
+    print("\n# save / load - example 2")
+    da = DynamicArray(["text", None, (1, 2), 3.5])
+    da.save(snapshot)
+    for use_mmap in (True, False):
+        print(DynamicArray.load(snapshot, mmap=use_mmap))
+    DynamicArray(typecode='d').save(snapshot)
+    print(DynamicArray.load(snapshot))
+    da = DynamicArray([1.5, 2.5, 3.5], typecode='d', circular=True)
+    da.appendleft(0.5)
+    da.save(snapshot)
+    print(DynamicArray.load(snapshot))
+
+    print("\n# save / load - example 3")
+    DynamicArray(range(100), typecode='q').save(snapshot)
+    with open(snapshot, "rb") as source:
+        content = source.read()
+    damaged = (content[:30],                    # truncated header
+               content[:500],                   # truncated elements
+               b"NOTASNAP" + content[8:])       # corrupt magic
+    for data in damaged:
+        with open(snapshot, "wb") as target:
+            target.write(data)
+        try:
+            DynamicArray.load(snapshot)
+            print("loaded")
+        except DynamicArrayException as e:
+            print("Exception raised:", type(e))
+    DynamicArray([1, 2, 3]).save(snapshot)
+    with open(snapshot, "rb") as source:
+        content = source.read()
+    with open(snapshot, "wb") as target:
+        target.write(content[:-5])              # truncated pickle stream
+    try:
+        DynamicArray.load(snapshot)
+        print("loaded")
+    except DynamicArrayException as e:
+        print("Exception raised:", type(e))
+
+    print("\n# attach / refresh - example 1")
+    backing = snapshot_dir.name + "/da.bin"
+    writer = DynamicArray([1, 2, 3], typecode='q', path=backing)
+    writer.flush()
+    reader = DynamicArray.attach(backing)
+    print(reader, reader.is_readonly())
+    for value in range(4, 20):
+        writer.append(value)
+    print(reader)
+    writer.flush()
+    reader.refresh()
+    print(reader)
+    writer[0] = -1
+    writer.pop()
+    writer.flush()
+    reader.refresh()
+    print(reader)
+
+    print("\n# attach / refresh - example 2")
+    for method, args in (("append", (1,)), ("pop", ()), ("clear", ()),
+                         ("insert_at_index", (0, 5)), ("flush", ())):
+        try:
+            getattr(reader, method)(*args)
+            print(method, "allowed")
+        except DynamicArrayException as e:
+            print(method, "- Exception raised:", type(e))
+    try:
+        reader[0] = 10
+        print("setitem allowed")
+    except TypeError as e:
+        print("setitem - Exception raised:", type(e))
+    try:
+        DynamicArray([1], typecode='q', path=backing)
+        print("overwrote existing file")
+    except DynamicArrayException as e:
+        print("create - Exception raised:", type(e))
+
+    print("\n# attach / refresh - example 3")
+    reader.close()
+    writer.append(100)
+    writer.close()
+    print(writer, writer.get_path())
+    appender = DynamicArray.attach(backing, readonly=False)
+    appender.append(200)
+    appender.close()
+    reader = DynamicArray.attach(backing)
+    print(reader)
+    reader.close()
+
+    print("\n# GrowthPolicy - example 1")
+    try:
+        GrowthPolicy(4, 0.5)
+    except DynamicArrayException as e:
+        print("Exception raised:", type(e))
+    da = DynamicArray(range(100), policy=GrowthPolicy(4, 0.2))
+    capacities = DynamicArray()
+    while not da.is_empty():
+        da.pop()
+        if capacities.is_empty() or capacities[capacities.length() - 1] != da.get_capacity():
+            capacities.append(da.get_capacity())
+    print(capacities)
+
+    print("\n# attach / refresh - example 4")
+    backing = snapshot_dir.name + "/writer.bin"
+    writer = DynamicArray([1, 2, 3], typecode='q', path=backing)
+    writer.append(4)
+    try:
+        writer.refresh()
+    except DynamicArrayException as e:
+        print("Exception raised:", type(e))
+    print(writer)
+    writer.flush(kind=0)
+    writer.flush(arity=3)
+    reader = DynamicArray.attach(backing)
+    print(reader)
+    reader.close()
+    writer.close()
+
+    print("\n# view - example 1")
+    da = DynamicArray(range(1, 9), circular=True)
+    da.reserve(16)
+    v = da.view(2, 3)
+    print(v, v.is_valid())
+    da.popleft()
+    print(v.is_valid())
+    try:
+        print(v[0])
+    except DynamicArrayException as e:
+        print("Exception raised:", type(e))
+    v = da.view(2, 3)
+    da.clear()
+    da.extend(range(10, 20))
+    print(v.is_valid())
@@ -0,0 +1,241 @@
+# Name: Seongyeong Ju
+# OSU Email: jus@oregonstate.edu
+# Course: CS261 - Data Structures
+# Description: External-memory sort built on MinHeap for data larger than RAM
+
+
+import os
+import pickle
+import tempfile
+
+from min_heap import *
+
+
+MIN_IO_BUFFER = 1 << 12     # smallest buffer given to any open file
+
+
+def external_sort(iterable, key=None, reverse=False, buffer_size: int = 100000,
+                  fan_in: int = 64, temp_dir: str = None,
+                  io_buffer: int = 1 << 24):
+    """
+    Sorts objects of any iterable using at most buffer_size objects of memory
+    and yields them in ascending order (descending with reverse=True)
+    Sorted runs are produced by replacement selection on a MinHeap, which
+    makes them about twice as long as the buffer on random input, and are
+    spilled sequentially to temporary files that are k-way merged at most
+    fan_in at a time. Objects must be picklable
+    io_buffer is the number of bytes of file buffering, shared by every run
+    file open at once (up to fan_in + 1 while merging), and counts toward
+    the memory budget alongside buffer_size
+    """
+    if buffer_size < 1 or fan_in < 2:
+        raise MinHeapException
+    buffering = _buffering(io_buffer, fan_in + 1)
+    with tempfile.TemporaryDirectory(dir=temp_dir) as directory:
+        runs = _generate_runs(iter(iterable), key, reverse, buffer_size,
+                              directory, buffering)
+
+        # merge groups of runs into longer runs until one pass is enough
+        generation = 0
+        while runs.length() > fan_in:
+            merged = DynamicArray()
+            for start in range(0, runs.length(), fan_in):
+                group = runs.slice(start, min(fan_in, runs.length() - start))
+                path = os.path.join(directory, f"merge-{generation}-{start}.run")
+                _write_run(path, _merge_runs(group, key, reverse, buffering),
+                           buffering)
+                for run in group:
+                    os.remove(run)
+                merged.append(path)
+            runs = merged
+            generation += 1
+
+        yield from _merge_runs(runs, key, reverse, buffering)
+
+
+def external_sort_file(input_path: str, output_path: str, key=None,
+                       reverse=False, buffer_size: int = 100000,
+                       fan_in: int = 64, temp_dir: str = None,
+                       io_buffer: int = 1 << 24) -> None:
+    """
+    Sorts the lines of a text file into another text file with
+    external_sort(), reading and writing both files sequentially
+    The input and output files take their buffers out of io_buffer too
+    """
+    buffering = _buffering(io_buffer, fan_in + 3)
+    with open(input_path, "r", buffering=buffering) as source, \
+            open(output_path, "w", buffering=buffering) as target:
+        for line in external_sort(_lines(source), key, reverse, buffer_size,
+                                  fan_in, temp_dir, io_buffer - 2 * buffering):
+            target.write(line)
+            target.write("\n")
+
+
+def _generate_runs(iterator, key, reverse: bool, buffer_size: int,
+                   directory: str, buffering: int) -> DynamicArray:
+    """
+    Helper function to split iterator into sorted run files by replacement
+    selection and return a DynamicArray of their paths
+    Heap entries are (run, key, sequence, object): an object that cannot
+    extend the current run any more is tagged with the next run number, so
+    it sinks below every object of the current run
+    """
+    runs = DynamicArray()
+    sequence = 0
+    initial = DynamicArray()
+    for node in iterator:
+        initial.append((0, _sort_key(node, key, reverse), sequence, node))
+        sequence += 1
+        if initial.length() == buffer_size:
+            break
+    heap = MinHeap.from_dynamic_array(initial, copy=False)
+
+    current_run = -1
+    run_file = None
+    pickler = None
+    try:
+        while not heap.is_empty():
+            run, node_key, _, node = heap.get_min()
+            if run != current_run:
+                if run_file is not None:
+                    run_file.close()
+                path = os.path.join(directory, f"run-{run}.run")
+                run_file = open(path, "wb", buffering=buffering)
+                pickler = pickle.Pickler(run_file, pickle.HIGHEST_PROTOCOL)
+                runs.append(path)
+                current_run = run
+            pickler.dump(node)
+            pickler.clear_memo()
+
+            # refill the slot just freed from the input
+            for next_node in iterator:
+                next_key = _sort_key(next_node, key, reverse)
+                next_run = run + 1 if next_key < node_key else run
+                heap.replace((next_run, next_key, sequence, next_node))
+                sequence += 1
+                break
+            else:
+                heap.remove_min()
+    finally:
+        if run_file is not None:
+            run_file.close()
+    return runs
+
+
+def _merge_runs(runs: DynamicArray, key, reverse: bool, buffering: int):
+    """
+    Helper function to lazily k-way merge the given run files
+    """
+    readers = DynamicArray()
+    for path in runs:
+        readers.append(_read_run(path, buffering))
+    try:
+        yield from merge(*readers, key=key, reverse=reverse)
+    finally:
+        for reader in readers:
+            reader.close()
+
+
+def _write_run(path: str, nodes, buffering: int) -> None:
+    """
+    Helper function to write objects sequentially to a run file
+    """
+    with open(path, "wb", buffering=buffering) as run_file:
+        pickler = pickle.Pickler(run_file, pickle.HIGHEST_PROTOCOL)
+        for node in nodes:
+            pickler.dump(node)
+            pickler.clear_memo()
+
+
+def _read_run(path: str, buffering: int):
+    """
+    Helper function to read the objects of a run file back sequentially
+    """
+    with open(path, "rb", buffering=buffering) as run_file:
+        unpickler = pickle.Unpickler(run_file)
+        while True:
+            try:
+                yield unpickler.load()
+            except EOFError:
+                return
+
+
+def _buffering(io_buffer: int, files: int) -> int:
+    """
+    Helper function to split io_buffer bytes evenly between files open files
+    """
+    return max(io_buffer // files, MIN_IO_BUFFER)
+
+
+def _lines(source):
+    """
+    Helper function to yield the lines of a text file without line endings
+    """
+    for line in source:
+        yield line.rstrip("\n")
+
+
+def _sort_key(node: object, key, reverse: bool) -> object:
+    """
+    Helper function to return the value runs are ordered by
+    """
+    value = node if key is None else key(node)
+    return _Reversed(value) if reverse else value
+
+
+class _Reversed:
+    """
+    Wrapper inverting the order of a value, so descending runs can be built
+    with the MinHeap
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __lt__(self, other: "_Reversed") -> bool:
+        return other.value < self.value
+
+    def __eq__(self, other: "_Reversed") -> bool:
+        return self.value == other.value
+
+
+# ------------------- BASIC TESTING -----------------------------------------
+
+
+if __name__ == '__main__':
+
+    print("\nexternal_sort example 1")
+    print("-----------------------")
+    values = DynamicArray((value * 7919) % 1000 for value in range(1000))
+    result = DynamicArray(external_sort(values, buffer_size=10, fan_in=2))
+    print(result.length(), list(result) == sorted(values))
+    print(result.slice(0, 5))
+    print(DynamicArray(external_sort([5, 3, 8, 1, 9, 2], buffer_size=2)))
+    print(DynamicArray(external_sort([])))
+
+    print("\nexternal_sort example 2")
+    print("-----------------------")
+    words = ['monkey', 'zebra', 'elephant', 'horse', 'bear', 'cat', 'ox']
+    print(DynamicArray(external_sort(words, reverse=True, buffer_size=2, fan_in=2)))
+    print(DynamicArray(external_sort(words, key=len, buffer_size=2, fan_in=2)))
+    print(DynamicArray(external_sort(words, key=len, reverse=True,
+                                     buffer_size=3, fan_in=3)))
+    try:
+        DynamicArray(external_sort(words, fan_in=1))
+    except MinHeapException as e:
+        print("Exception raised:", type(e))
+
+    print("\nexternal_sort_file example 1")
+    print("----------------------------")
+    with tempfile.TemporaryDirectory() as directory:
+        source = os.path.join(directory, "in.txt")
+        target = os.path.join(directory, "out.txt")
+        with open(source, "w") as source_file:
+            source_file.write("\n".join(str(value) for value in range(200, 0, -3)))
+        external_sort_file(source, target, key=int, buffer_size=5, fan_in=2,
+                           io_buffer=1 << 14)
+        with open(target) as target_file:
+            lines = target_file.read().split("\n")
+        print(len(lines) - 1, lines[:5], lines[-2])
@@ -7,6 +7,15 @@
 
 
 from dynamic_array import *
+from dynamic_array import (_ArrayStats, _attach_file, _count, _read_snapshot,
+                           _write_snapshot)
+
+
+_HANDLE_SLOT_BITS = 32      # IndexedMinHeap handle = generation << 32 | slot
+_HANDLE_SLOT_MASK = (1 << _HANDLE_SLOT_BITS) - 1
+
+_HEAP_SNAPSHOT = 1          # snapshot kinds written by MinHeap.save()
+_KEYED_HEAP_SNAPSHOT = 2
 
 
 class MinHeapException(Exception):
@@ -18,41 +27,152 @@ class MinHeapException(Exception):
 
 
 class MinHeap:
-    def __init__(self, start_heap=None):
+    def __init__(self, start_heap=None, typecode=None, key=None, arity=2,
+                 path=None):
         """
         Initialize a new MinHeap
-        DO NOT CHANGE THIS METHOD IN ANY WAY
+        A typecode (e.g. 'q' or 'd') keeps the heap in a typed DynamicArray
+        A key function orders objects by key(object), computed once per object
+        on insertion, with ties broken by insertion order
+        arity sets the number of children per node (2 for a binary heap)
+        A typed heap with a path keeps its array in a new memory-mapped file
+        that other processes can attach() to after flush(); an existing file
+        is reopened with attach(path, readonly=False) instead
         """
-        self._heap = DynamicArray()
+        if key is not None and typecode is not None:
+            raise MinHeapException
+        if arity < 2 or (path is not None and typecode is None):
+            raise MinHeapException
+        self._heap = DynamicArray(typecode=typecode, path=path)
+        self._key = key
+        self._count = 0
+        self._arity = arity
+        self._stats = None
+        self._sift_up = _sift_up        # replaced by counting versions
+        self._sift_down = _sift_down    # while stats are enabled
+        self._heapify = _heapify
 
-        # populate MH with initial values (if provided)
-        # before using this feature, implement add() method
+        # populate MH with initial values (if provided) and heapify in O(N)
         if start_heap:
-            for node in start_heap:
-                self.add(node)
+            self._load(start_heap)
+
+    @classmethod
+    def from_iterable(cls, iterable, typecode=None, key=None,
+                      arity=2) -> "MinHeap":
+        """
+        Returns a new MinHeap holding the objects of iterable, copied in one
+        pass and heapified in O(N)
+        """
+        heap = cls(typecode=typecode, key=key, arity=arity)
+        heap._load(iterable)
+        return heap
+
+    @classmethod
+    def from_dynamic_array(cls, da: DynamicArray, copy: bool = True,
+                           key=None, arity=2) -> "MinHeap":
+        """
+        Returns a new MinHeap built from da in O(N)
+        With copy=False the heap takes ownership of da and rearranges it in
+        place, so da must not be used by the caller afterwards
+        A heap with a key function always copies da, and so does one built
+        from a DynamicArrayView or a read-only array, which cannot grow or
+        shrink with the heap
+        """
+        if key is not None:
+            return cls.from_iterable(da, None, key, arity)
+        if copy or isinstance(da, DynamicArrayView) or da.is_readonly():
+            return cls.from_iterable(da, da.get_typecode(), None, arity)
+        heap = cls(typecode=da.get_typecode(), arity=arity)
+        heap._heap = da
+        heap._heapify(da.get_storage(), da.length(), arity)
+        return heap
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True, key=None) -> "MinHeap":
+        """
+        Returns a MinHeap read from a snapshot written by save()
+        The array is already in heap order, so no heapify is needed, and
+        with mmap=True a typed snapshot is mapped instead of read (see
+        DynamicArray.load). A snapshot of a plain DynamicArray is heapified
+        A heap saved with a key function must be loaded with one, since
+        functions are not stored
+        """
+        da, kind, arity, count = _read_snapshot(path, mmap)
+        if (kind == _KEYED_HEAP_SNAPSHOT) != (key is not None):
+            raise MinHeapException
+        heap = cls(typecode=None if key else da.get_typecode(), key=key,
+                   arity=arity if kind else 2)
+        heap._heap = da
+        heap._count = count
+        if not kind:
+            heap._heapify(da.get_storage(), da.length(), heap._arity)
+        return heap
+
+    @classmethod
+    def attach(cls, path: str, readonly: bool = True) -> "MinHeap":
+        """
+        Returns a MinHeap mapped onto the file of a file-backed heap without
+        copying it (see DynamicArray.attach)
+        Read-only heaps support get_min(), size() and str() over the
+        state published by the writer's last flush(); call refresh() to
+        catch up. Reads that race with the writer's changes may see a
+        partially updated heap
+        """
+        da, kind, arity, count = _attach_file(path, readonly)
+        if kind != _HEAP_SNAPSHOT:
+            raise MinHeapException
+        heap = cls(typecode=da.get_typecode(), arity=arity)
+        heap._heap = da
+        heap._count = count
+        return heap
+
+    def flush(self) -> None:
+        """
+        Publishes the heap in its backing file for attached readers
+        Raises a DynamicArrayException if the heap is not file-backed
+        """
+        self._heap.flush(_HEAP_SNAPSHOT, self._arity, self._count)
+
+    def refresh(self) -> None:
+        """
+        Catches an attached heap up with the writer's last flush()
+        Raises a DynamicArrayException unless the heap is attached read-only
+        """
+        self._heap.refresh()
+
+    def close(self) -> None:
+        """
+        Releases the mapping and file of a file-backed heap, publishing it
+        first unless it is read-only (see DynamicArray.close)
+        """
+        if self._heap.get_path() is not None and not self._heap.is_readonly():
+            self.flush()
+        self._heap.close()
+
+    def save(self, path: str) -> None:
+        """
+        Writes the heap to a binary snapshot file at path, keeping its
+        array in heap order (see DynamicArray.save)
+        """
+        kind = _HEAP_SNAPSHOT if self._key is None else _KEYED_HEAP_SNAPSHOT
+        _write_snapshot(path, self._heap, kind, self._arity, self._count)
 
     def __str__(self) -> str:
         """
         Return MH content in human-readable form
-        DO NOT CHANGE THIS METHOD IN ANY WAY
         """
-        heap_data = [self._heap[i] for i in range(self._heap.length())]
+        heap_data = [self._item(entry) for entry in self._heap]
         return 'HEAP ' + str(heap_data)
 
     def add(self, node: object) -> None:
         """
         Adds new object to MinHeap while maintaining heap property
         """
+        if self._key is not None:
+            node = (self._key(node), self._count, node)
+            self._count += 1
         self._heap.append(node)
-        inserted_index = self.size() - 1
-        parent_index = (inserted_index - 1) // 2
-        while inserted_index > 0 and self._heap[inserted_index] < self._heap[parent_index]:
-            # if value in parent index is greater than inserted index, swap
-            temp = self._heap[inserted_index]
-            self._heap[inserted_index] = self._heap[parent_index]
-            self._heap[parent_index] = temp
-            inserted_index = parent_index 
-            parent_index = (inserted_index - 1) // 2
+        self._sift_up(self._heap.get_storage(), self._heap.length() - 1, self._arity)
 
     def is_empty(self) -> bool:
         """
@@ -68,7 +188,7 @@ class MinHeap:
         """
         if self._heap.length() == 0:
             raise MinHeapException
-        return self._heap[0]
+        return self._item(self._heap[0])
 
     def remove_min(self) -> object:
         """
@@ -77,27 +197,116 @@ class MinHeap:
         """
         if self.size() == 0:
             raise MinHeapException
-        
-        # save minimum value to return later 
-        min_val = self.get_min()
-        # replace first element value with last element value 
-        self._heap[0] = self._heap[self.size() - 1]
-        self._heap._size -= 1  # remove last element 
 
-        _percolate_down(self._heap, 0, self._heap.length())
+        # take the last element off the array, releasing spare capacity
+        last = self._heap.pop()
+        if self._heap.is_empty():
+            return self._item(last)
+
+        # save minimum value to return later and sift last down from the root
+        data = self._heap.get_storage()
+        min_val = data[0]
+        data[0] = last
+        self._sift_down(data, 0, self._heap.length(), self._arity)
+
+        return self._item(min_val)
+
+    def pushpop(self, node: object) -> object:
+        """
+        Adds new object and then removes and returns the minimum object with
+        at most one sift down
+        If the new object is not greater than the minimum, it is returned
+        directly without touching the heap
+        """
+        entry = node
+        if self._key is not None:
+            entry = (self._key(node), self._count, node)
+            self._count += 1
+        if self._heap.is_empty():
+            return node
+        data = self._heap.get_storage()
+        root = data[0]
+        if not root < entry:
+            return node
+        data[0] = entry
+        self._sift_down(data, 0, self._heap.length(), self._arity)
+        return self._item(root)
+
+    def replace(self, node: object) -> object:
+        """
+        Removes and returns the minimum object and then adds new object with
+        a single sift down
+        Raises a MinHeapException if heap is empty
+        """
+        if self._heap.is_empty():
+            raise MinHeapException
+        if self._key is not None:
+            node = (self._key(node), self._count, node)
+            self._count += 1
+        data = self._heap.get_storage()
+        root = data[0]
+        data[0] = node
+        self._sift_down(data, 0, self._heap.length(), self._arity)
+        return self._item(root)
+
+    def push_many(self, values) -> None:
+        """
+        Adds every object from values while maintaining heap property
+        Small batches are sifted up one by one in O(K log N), while batches
+        large enough for that to cost more than rebuilding re-heapify the
+        whole heap in O(N + K)
+        """
+        start = self._heap.length()
+        self._append_all(values)
+        length = self._heap.length()
+        data = self._heap.get_storage()
+
+        # sifting up K items costs about K log N, heapify about 2N
+        if (length - start) * length.bit_length() > 2 * length:
+            self._heapify(data, length, self._arity)
+        else:
+            for index in range(start, length):
+                self._sift_up(data, index, self._arity)
 
-        return min_val
+    def pop_many(self, k: int) -> DynamicArray:
+        """
+        Removes up to k objects with the smallest values and returns them in
+        a new DynamicArray in ascending order
+        Raises a MinHeapException if k is negative
+        """
+        if k < 0:
+            raise MinHeapException
+        result = DynamicArray(typecode=self._heap.get_typecode())
+        while k > 0 and not self._heap.is_empty():
+            last = self._heap.pop()
+            length = self._heap.length()
+            if length == 0:
+                result.append(self._item(last))
+                break
+            # move the last element into the root and sift it down
+            data = self._heap.get_storage()
+            result.append(self._item(data[0]))
+            data[0] = last
+            self._sift_down(data, 0, length, self._arity)
+            k -= 1
+        return result
 
     def build_heap(self, da: DynamicArray) -> None:
         """
         Builds a proper MinHeap from given DynamicArray with objects in
         any order with current content overwritten 
         """
-        self._heap = DynamicArray(da)
-        parent_index = (self.size() // 2) - 1 # (i − 1) / 2
-        while parent_index >= 0:
-            _percolate_down(self._heap, parent_index, self._heap.length())
-            parent_index -= 1
+        typecode = self._heap.get_typecode()
+        if typecode is None and self._key is None:
+            typecode = da.get_typecode()
+        if self._heap.get_path() is not None:
+            self._heap.clear()     # keep the backing file
+        else:
+            self._heap = DynamicArray(typecode=typecode)
+        self._count = 0
+        if self._stats is not None:
+            self._heap.enable_stats(stats=self._stats.storage)
+        self._load(da)
 
     def size(self) -> int:
         """
@@ -109,51 +318,805 @@ class MinHeap:
         """
         Clears the contents of the heap 
         """
-        self._heap = DynamicArray()
-    
+        if self._heap.get_path() is not None:
+            self._heap.clear()     # keep the backing file
+        else:
+            self._heap = DynamicArray(typecode=self._heap.get_typecode())
+        self._count = 0
+        if self._stats is not None:
+            self._heap.enable_stats(stats=self._stats.storage)
+
+    def enable_stats(self, callback=None, interval: int = 1) -> None:
+        """
+        Start counting comparisons, element moves (swaps) and sift depths of
+        every heap operation, and resizes of the heap's storage
+        callback, if given, receives the stats() dict after every interval
+        operations
+        While disabled the heap runs the uninstrumented sift functions, so
+        instrumentation costs nothing
+        """
+        self._stats = _HeapStats(self._heap.get_capacity(), callback, interval)
+        self._heap.enable_stats(stats=self._stats.storage)
+        self._sift_up = self._stats.sift_up
+        self._sift_down = self._stats.sift_down
+        self._heapify = self._stats.heapify
+
+    def disable_stats(self) -> None:
+        """
+        Stop counting, drop the counters and restore the plain sift functions
+        """
+        self._stats = None
+        self._heap.disable_stats()
+        self._sift_up = _sift_up
+        self._sift_down = _sift_down
+        self._heapify = _heapify
+
+    def stats(self) -> dict:
+        """
+        Return a dict of the counters, or None while instrumentation is
+        disabled
+        sift_depths[d] is the number of operations that moved an element d
+        levels; storage holds the DynamicArray counters
+        """
+        if self._stats is None:
+            return None
+        return self._stats.as_dict()
+
+    def _load(self, values) -> None:
+        """
+        Helper method to append values to the heap in one pass and restore
+        the heap property in O(N)
+        """
+        self._append_all(values)
+        self._heapify(self._heap.get_storage(), self._heap.length(), self._arity)
+
+    def _append_all(self, values) -> None:
+        """
+        Helper method to append values to the end of the heap storage in one
+        pass without restoring the heap property
+        """
+        if self._key is None:
+            self._heap.extend(values)
+        else:
+            key = self._key
+            count = self._count
+            for node in values:
+                self._heap.append((key(node), count, node))
+                count += 1
+            self._count = count
+
+    def _item(self, entry: object) -> object:
+        """
+        Helper method to return the object stored in a heap entry
+        """
+        if self._key is None:
+            return entry
+        return entry[2]
+
+
+class _HeapStats:
+    """
+    Opt-in counters of a MinHeap, with counting versions of the sift
+    functions that the heap uses while instrumentation is enabled
+    An operation is one sift up, sift down or heapify
+    """
+
+    def __init__(self, capacity: int = 0, callback=None, interval: int = 1):
+        """
+        Initialize zeroed counters; callback(stats dict) is called after
+        every interval operations
+        """
+        self.comparisons = 0
+        self.swaps = 0
+        self.operations = 0
+        self.depths = DynamicArray(typecode='q')   # depth -> operations
+        self.storage = _ArrayStats(capacity)
+        self._callback = callback
+        self._interval = interval
+
+    def as_dict(self) -> dict:
+        """
+        Return the counters as a dict
+        """
+        return {"comparisons": self.comparisons, "swaps": self.swaps,
+                "operations": self.operations,
+                "swaps_per_op": self.swaps / self.operations if self.operations else 0.0,
+                "sift_depths": [count for count in self.depths],
+                "storage": self.storage.as_dict()}
+
+    def sift_up(self, data, index: int, arity: int = 2) -> None:
+        """
+        Counting version of _sift_up
+        """
+        node = data[index]
+        moves = 0
+        while index > 0:
+            parent_index = (index - 1) // arity
+            parent = data[parent_index]
+            self.comparisons += 1
+            if not node < parent:
+                break
+            data[index] = parent
+            index = parent_index
+            moves += 1
+        data[index] = node
+        self.swaps += moves
+        self._finish(moves)
+
+    def sift_down(self, data, index: int, length: int, arity: int = 2) -> None:
+        """
+        Counting version of _sift_down
+        """
+        self._finish(self._sift_down(data, index, length, arity))
+
+    def heapify(self, data, length: int, arity: int = 2) -> None:
+        """
+        Counting version of _heapify, recorded as one operation whose
+        depth is that of its deepest sift
+        """
+        deepest = 0
+        parent_index = (length - 2) // arity
+        while parent_index >= 0:
+            moves = self._sift_down(data, parent_index, length, arity)
+            if moves > deepest:
+                deepest = moves
+            parent_index -= 1
+        self._finish(deepest)
+
+    def _sift_down(self, data, index: int, length: int, arity: int) -> int:
+        """
+        Helper method to sift the element at index down in a heap with
+        arity children per node, counting comparisons and swaps, and return
+        the number of levels it moved
+        """
+        node = data[index]
+        moves = 0
+        child_index = arity * index + 1
+        while child_index < length:
+            child = data[child_index]
+            last_index = child_index + arity
+            if last_index > length:
+                last_index = length
+            for other_index in range(child_index + 1, last_index):
+                other = data[other_index]
+                self.comparisons += 1
+                if other < child:
+                    child_index = other_index
+                    child = other
+            self.comparisons += 1
+            if not child < node:
+                break
+            data[index] = child
+            index = child_index
+            child_index = arity * index + 1
+            moves += 1
+        data[index] = node
+        self.swaps += moves
+        return moves
+
+    def _finish(self, moves: int) -> None:
+        """
+        Helper method to record one operation that moved an element moves
+        levels and call the callback when due
+        """
+        self.operations += 1
+        while self.depths.length() <= moves:
+            self.depths.append(0)
+        self.depths[moves] += 1
+        if self._callback is not None and self.operations % self._interval == 0:
+            self._callback(self.as_dict())
+
+
+class IndexedMinHeap:
+    """
+    MinHeap of (object, priority) entries addressed by integer handles
+    A position map kept up to date during sifts lets entries be updated or
+    removed in O(log N) and looked up in O(1). Slots of removed entries are
+    reused by later add() calls, but every handle carries the generation of
+    its slot, so a handle kept after its entry was removed stays invalid
+    """
+
+    def __init__(self):
+        """
+        Initialize a new IndexedMinHeap
+        """
+        self._heap = DynamicArray(typecode='q')        # slots in heap order
+        self._positions = DynamicArray(typecode='q')   # slot -> heap index or -1
+        self._generations = DynamicArray(typecode='q') # slot -> current generation
+        self._priorities = DynamicArray()              # slot -> priority
+        self._items = DynamicArray()                   # slot -> object
+        self._free = DynamicArray(typecode='q')        # slots available for reuse
+
+    def __str__(self) -> str:
+        """
+        Return content in human-readable form as (object, priority) pairs
+        """
+        heap_data = [(self._items[slot], self._priorities[slot])
+                     for slot in self._heap]
+        return 'INDEXED HEAP ' + str(heap_data)
+
+    def add(self, node: object, priority: object) -> int:
+        """
+        Adds new object with given priority and returns its handle
+        """
+        if self._free.is_empty():
+            slot = self._positions.length()
+            self._positions.append(-1)
+            self._generations.append(0)
+            self._priorities.append(priority)
+            self._items.append(node)
+        else:
+            slot = self._free.pop()
+            self._priorities[slot] = priority
+            self._items[slot] = node
+        self._heap.append(slot)
+        self._positions[slot] = self._heap.length() - 1
+        self._sift_up(self._heap.length() - 1)
+        return self._handle(slot)
+
+    def contains(self, handle: int) -> bool:
+        """
+        Returns True if handle refers to an entry currently in the heap
+        """
+        slot = handle & _HANDLE_SLOT_MASK
+        return (0 <= handle and slot < self._positions.length()
+                and self._positions[slot] >= 0
+                and self._generations[slot] == handle >> _HANDLE_SLOT_BITS)
+
+    def get_priority(self, handle: int) -> object:
+        """
+        Returns the priority of the entry with given handle and raises a
+        MinHeapException if the handle is not in the heap
+        """
+        return self._priorities[self._check(handle)]
+
+    def update(self, handle: int, priority: object) -> None:
+        """
+        Changes the priority of the entry with given handle in O(log N) and
+        raises a MinHeapException if the handle is not in the heap
+        """
+        slot = self._check(handle)
+        old_priority = self._priorities[slot]
+        self._priorities[slot] = priority
+        if priority < old_priority:
+            self._sift_up(self._positions[slot])
+        else:
+            self._sift_down(self._positions[slot])
+
+    def decrease_key(self, handle: int, priority: object) -> None:
+        """
+        Lowers the priority of the entry with given handle and raises a
+        MinHeapException if the new priority is greater than the current one
+        """
+        slot = self._check(handle)
+        if self._priorities[slot] < priority:
+            raise MinHeapException
+        self.update(handle, priority)
+
+    def remove(self, handle: int) -> object:
+        """
+        Removes the entry with given handle in O(log N) and returns its object
+        Raises a MinHeapException if the handle is not in the heap
+        """
+        slot = self._check(handle)
+        index = self._positions[slot]
+        last_index = self._heap.length() - 1
+        node = self._items[slot]
+
+        # move the last entry into the hole and restore heap order from there
+        if index != last_index:
+            last = self._heap[last_index]
+            self._heap[index] = last
+            self._positions[last] = index
+        self._heap.pop()
+        if index != last_index:
+            self._sift_up(index)
+            self._sift_down(self._positions[last])
+
+        self._release(slot)
+        return node
+
+    def is_empty(self) -> bool:
+        """
+        Returns True if heap is empty and False otherwise
+        """
+        return self._heap.is_empty()
+
+    def get_min(self) -> object:
+        """
+        Returns the object with minimum priority without removing it and
+        raises a MinHeapException if heap is empty
+        """
+        if self._heap.is_empty():
+            raise MinHeapException
+        return self._items[self._heap[0]]
+
+    def get_min_handle(self) -> int:
+        """
+        Returns the handle of the entry with minimum priority and raises a
+        MinHeapException if heap is empty
+        """
+        if self._heap.is_empty():
+            raise MinHeapException
+        return self._handle(self._heap[0])
+
+    def remove_min(self) -> object:
+        """
+        Removes the object with minimum priority and returns it
+        Raises a MinHeapException if heap is empty
+        """
+        return self.remove(self.get_min_handle())
+
+    def size(self) -> int:
+        """
+        Returns the number of entries stored in the heap
+        """
+        return self._heap.length()
+
+    def clear(self) -> None:
+        """
+        Clears the contents of the heap and invalidates all handles
+        """
+        for slot in self._heap:
+            self._release(slot)
+        self._heap = DynamicArray(typecode='q')
+
+    def _handle(self, slot: int) -> int:
+        """
+        Helper method to return the handle of the entry in slot
+        """
+        return (self._generations[slot] << _HANDLE_SLOT_BITS) | slot
+
+    def _check(self, handle: int) -> int:
+        """
+        Helper method to return the slot of handle and raise a
+        MinHeapException for a handle not in the heap
+        """
+        if not self.contains(handle):
+            raise MinHeapException
+        return handle & _HANDLE_SLOT_MASK
+
+    def _release(self, slot: int) -> None:
+        """
+        Helper method to free slot for reuse and invalidate its handle
+        """
+        self._positions[slot] = -1
+        self._generations[slot] += 1
+        self._priorities[slot] = None
+        self._items[slot] = None
+        self._free.append(slot)
+
+    def _sift_up(self, index: int) -> None:
+        """
+        Helper method to move the entry at index up toward the root, keeping
+        the position map in sync
+        """
+        heap = self._heap.get_storage()
+        positions = self._positions.get_storage()
+        priorities = self._priorities.get_storage()
+        handle = heap[index]
+        priority = priorities[handle]
+        while index > 0:
+            parent_index = (index - 1) >> 1
+            parent = heap[parent_index]
+            if not priority < priorities[parent]:
+                break
+            heap[index] = parent
+            positions[parent] = index
+            index = parent_index
+        heap[index] = handle
+        positions[handle] = index
+
+    def _sift_down(self, index: int) -> None:
+        """
+        Helper method to move the entry at index down toward the leaves,
+        keeping the position map in sync
+        """
+        heap = self._heap.get_storage()
+        positions = self._positions.get_storage()
+        priorities = self._priorities.get_storage()
+        length = self._heap.length()
+        handle = heap[index]
+        priority = priorities[handle]
+        child_index = 2 * index + 1
+        while child_index < length:
+            child = heap[child_index]
+            right_index = child_index + 1
+            if right_index < length and priorities[heap[right_index]] < priorities[child]:
+                child_index = right_index
+                child = heap[right_index]
+            if not priorities[child] < priority:
+                break
+            heap[index] = child
+            positions[child] = index
+            index = child_index
+            child_index = 2 * index + 1
+        heap[index] = handle
+        positions[handle] = index
+
+
+def nsmallest(k: int, iterable, key=None) -> DynamicArray:
+    """
+    Returns a new DynamicArray with the k smallest objects of iterable in
+    ascending order, equal objects keeping their input order
+    Only a bounded heap of k entries is kept, so iterable is consumed in
+    O(k) memory and O(N log k) time
+    """
+    heap = DynamicArray()
+    if k <= 0:
+        return heap
+    order = 0
+    for node in iterable:
+        entry = node if key is None else (key(node), order, node)
+        order += 1
+        if heap.length() < k:
+            heap.append(entry)
+            if heap.length() == k:
+                _heapify_max(heap.get_storage(), k)
+        elif entry < heap[0]:
+            # replace the largest of the k smallest seen so far
+            data = heap.get_storage()
+            data[0] = entry
+            _sift_down_max(data, 0, k)
+
+    # sort the max-heap in place into ascending order
+    data = heap.get_storage()
+    length = heap.length()
+    if length < k:
+        _heapify_max(data, length)
+    while length > 1:
+        length -= 1
+        last = data[length]
+        data[length] = data[0]
+        data[0] = last
+        _sift_down_max(data, 0, length)
+    return heap if key is None else heap.map(_entry_item)
+
+
+def nlargest(k: int, iterable, key=None) -> DynamicArray:
+    """
+    Returns a new DynamicArray with the k largest objects of iterable in
+    descending order, equal objects keeping their input order
+    Only a bounded MinHeap of k entries is kept, so iterable is consumed in
+    O(k) memory and O(N log k) time
+    """
+    heap = DynamicArray()
+    if k <= 0:
+        return heap
+    order = 0
+    for node in iterable:
+        entry = node if key is None else (key(node), order, node)
+        order -= 1
+        if heap.length() < k:
+            heap.append(entry)
+            if heap.length() == k:
+                _heapify(heap.get_storage(), k)
+        elif heap[0] < entry:
+            # replace the smallest of the k largest seen so far
+            data = heap.get_storage()
+            data[0] = entry
+            _sift_down(data, 0, k)
+
+    # heapsort leaves the MinHeap in non-ascending order
+    heapsort(heap)
+    return heap if key is None else heap.map(_entry_item)
+
+
+def most_common(k: int, iterable, chunked: bool = False) -> DynamicArray:
+    """
+    Returns a new DynamicArray with (object, count) tuples for the k most
+    frequent objects of iterable, most frequent first and equal counts in
+    order of first appearance
+    iterable (or, with chunked=True, an iterable of chunks) is counted in
+    one pass by hash, then a bounded MinHeap of k entries selects the top k
+    """
+    result = DynamicArray()
+    if k <= 0:
+        return result
+    heap = MinHeap()
+    order = 0
+    for node, count in _count(iterable, chunked).items():
+        entry = (count, order, node)
+        order -= 1
+        if heap.size() < k:
+            heap.add(entry)
+        elif heap.get_min() < entry:
+            heap.replace(entry)
+
+    # pop_many returns the least frequent first
+    entries = heap.pop_many(k)
+    for index in range(entries.length() - 1, -1, -1):
+        count, _, node = entries[index]
+        result.append((node, count))
+    return result
+
+
+def merge(*iterables, key=None, reverse=False):
+    """
+    Lazily merges sorted iterables into one sorted stream
+    Every input must be in ascending order (descending with reverse=True);
+    objects compare equal keep the order of their inputs
+    One head per input is kept in a heap, so memory is O(k) for k inputs,
+    inputs are read only as their objects are needed, and each emitted
+    object costs a single root replacement and sift down
+    """
+    heap = DynamicArray()
+    sign = -1 if reverse else 1
+    order = 0
+    for iterable in iterables:
+        iterator = iter(iterable)
+        for node in iterator:
+            heap.append((node if key is None else key(node), sign * order, node, iterator))
+            break
+        order += 1
+
+    heapify = _heapify_max if reverse else _heapify
+    sift_down = _sift_down_max if reverse else _sift_down
+    heapify(heap.get_storage(), heap.length())
+
+    while not heap.is_empty():
+        data = heap.get_storage()
+        entry = data[0]
+        yield entry[2]
+        iterator = entry[3]
+        for node in iterator:
+            # replace the root with the next object from the same input
+            data[0] = (node if key is None else key(node), entry[1], node, iterator)
+            sift_down(data, 0, heap.length())
+            break
+        else:
+            # input exhausted, move the last head to the root
+            last = heap.pop()
+            if not heap.is_empty():
+                data = heap.get_storage()
+                data[0] = last
+                sift_down(data, 0, heap.length())
+
+
+def _entry_item(entry: tuple) -> object:
+    """
+    Helper function to return the object stored in a (key, order, object)
+    heap entry
+    """
+    return entry[2]
+
+
+def heapsort(da: DynamicArray, reverse: bool = False, key=None,
+             arity: int = 2) -> None:
+    """
+    Uses heapsort algorithm to sort Dynamic Array into non-ascending order,
+    or into non-descending order with reverse=True
+    Sorts the array in place; with a key function every key is computed once
+    and objects with equal keys keep their original order
+    arity sets the number of children per node of the intermediate heap
+    Input that is already in order, or in exactly the opposite order, is
+    finished in O(N)
+    """
+    if arity < 2:
+        raise MinHeapException
+    length = da.length()
+    if key is None:
+        _heapsort(da.get_storage(), length, arity, reverse)
+        return
+
+    # sort (key, position, object) entries, then write the objects back
+    # the sign of the position keeps equal keys in their original order
+    sign = 1 if reverse else -1
+    entries = DynamicArray()
+    position = 0
+    for node in da:
+        entries.append((key(node), sign * position, node))
+        position += 1
+    _heapsort(entries.get_storage(), length, arity, reverse)
+    data = da.get_storage()
+    sorted_entries = entries.get_storage()
+    for index in range(length):
+        data[index] = sorted_entries[index][2]
+
+
+def _heapsort(data, length: int, arity: int, reverse: bool) -> None:
+    """
+    Helper function to sort the first length elements of data in place into
+    non-ascending order, or non-descending order if reverse is True
+    """
+    order = _run_order(data, length)
+    if order != 0:
+        # already sorted one way or the other
+        if (order < 0) != reverse:
+            _reverse(data, length)
+        return
+
+    _heapify(data, length, arity)
+    k = length - 1
+    while k > 0:
+        # move root to k and sift the old value at k down from the root
+        last = data[k]
+        data[k] = data[0]
+        if arity == 2:
+            _sift_root_bottom_up(data, last, k)
+        else:
+            data[0] = last
+            _sift_down(data, 0, k, arity)
+        k -= 1
+
+    if reverse:
+        _reverse(data, length)
+
+
+def _run_order(data, length: int) -> int:
+    """
+    Helper function to return 1 if the first length elements of data are in
+    non-ascending order, -1 if they are in non-descending order and 0 if
+    they are in neither
+    Stops at the first element that breaks both orders
+    """
+    non_ascending = True
+    non_descending = True
+    index = 1
+    while index < length:
+        previous = data[index - 1]
+        current = data[index]
+        if previous < current:
+            non_ascending = False
+            if not non_descending:
+                return 0
+        elif current < previous:
+            non_descending = False
+            if not non_ascending:
+                return 0
+        index += 1
+    return 1 if non_ascending else -1
+
+
+def _reverse(data, length: int) -> None:
+    """
+    Helper function to reverse the first length elements of data in place
+    """
+    low = 0
+    high = length - 1
+    while low < high:
+        temp = data[low]
+        data[low] = data[high]
+        data[high] = temp
+        low += 1
+        high -= 1
+
 
-def heapsort(da: DynamicArray) -> None:
+def _heapify(data, length: int, arity: int = 2) -> None:
     """
-    Uses heapsort algorithm to sort Dynamic Array into non-ascending order
-    Sorts the array in place without creating any data structures
+    Helper function to arrange the first length elements of data into a
+    MinHeap in O(N)
     """
-    parent_index = (da.length() // 2) - 1 # (i − 1) / 2
+    parent_index = (length - 2) // arity # last parent = (n - 2) / d
     while parent_index >= 0:
-        _percolate_down(da, parent_index, da.length())
+        _sift_down(data, parent_index, length, arity)
         parent_index -= 1
 
-    k = da.length() - 1
-    while k >= 0:
-        # swap k with root 
-        temp = da[k]
-        da[k] = da[0]
-        da[0] = temp
-        # percolate down from root to k-1
-        # decrement k by 1 
-        _percolate_down(da, 0, k)
-        k -= 1
 
-def _percolate_down(da: DynamicArray, parent_index: int, length: int) -> None:
-    """
-    Helper function to percolate down the MinHeap
-    """
-    left_index = (2 * parent_index) + 1 # left child = 2 * i + 1
-    right_index = (2 * parent_index) + 2 # right child = 2 * i + 2
-    smallest = parent_index
-    # if left child is less than the parent, assign as new smallest
-    if left_index < length and da[left_index] < da[parent_index]:
-        smallest = left_index
-    # if right child is less than the smallest, assign as new smallest
-    if right_index < length and da[right_index] < da[smallest]:
-        smallest = right_index 
-    # if the smallest is not the parent, swap the parent with smallest value
-    if smallest != parent_index:
-        temp = da[smallest]
-        da[smallest] = da[parent_index]
-        da[parent_index] = temp
-        parent_index = smallest
-        # call function recursively to keep percolating 
-        _percolate_down(da, parent_index, length)
+def _sift_up(data, index: int, arity: int = 2) -> None:
+    """
+    Helper function to move the element at index up toward the root
+    Larger parents are shifted down into the hole instead of being swapped,
+    and the element is written once at its final position
+    """
+    node = data[index]
+    while index > 0:
+        parent_index = (index - 1) // arity # parent = (i - 1) / d
+        parent = data[parent_index]
+        if not node < parent:
+            break
+        data[index] = parent
+        index = parent_index
+    data[index] = node
+
+
+def _sift_down(data, index: int, length: int, arity: int = 2) -> None:
+    """
+    Helper function to move the element at index down within the first
+    length elements of data
+    Smaller children are shifted up into the hole instead of being swapped,
+    and the element is written once at its final position
+    """
+    node = data[index]
+    if arity != 2:
+        _sift_down_d(data, node, index, length, arity)
+        return
+
+    child_index = 2 * index + 1 # left child = 2 * i + 1
+    while child_index < length:
+        child = data[child_index]
+        right_index = child_index + 1 # right child = 2 * i + 2
+        if right_index < length:
+            right = data[right_index]
+            if right < child:
+                child_index = right_index
+                child = right
+        if not child < node:
+            break
+        data[index] = child
+        index = child_index
+        child_index = 2 * index + 1
+    data[index] = node
+
+
+def _sift_root_bottom_up(data, node: object, length: int) -> None:
+    """
+    Helper function to place node into the hole at the root of a binary
+    MinHeap of length elements using Floyd's bottom-up sift
+    The hole first moves down to a leaf along the smaller children with one
+    comparison per level, then node is sifted up from there; since node
+    usually came from the bottom of the heap it rarely moves far back up
+    """
+    index = 0
+    child_index = 1
+    while child_index < length:
+        right_index = child_index + 1
+        if right_index < length and data[right_index] < data[child_index]:
+            child_index = right_index
+        data[index] = data[child_index]
+        index = child_index
+        child_index = 2 * index + 1
+    data[index] = node
+    _sift_up(data, index)
+
+
+def _sift_down_d(data, node: object, index: int, length: int, arity: int) -> None:
+    """
+    Helper function to sift node down from the hole at index in a heap with
+    arity children per node
+    """
+    child_index = arity * index + 1 # first child = d * i + 1
+    while child_index < length:
+        # find the smallest of the (up to) arity children
+        child = data[child_index]
+        last_index = child_index + arity
+        if last_index > length:
+            last_index = length
+        for other_index in range(child_index + 1, last_index):
+            other = data[other_index]
+            if other < child:
+                child_index = other_index
+                child = other
+        if not child < node:
+            break
+        data[index] = child
+        index = child_index
+        child_index = arity * index + 1
+    data[index] = node
+
+
+def _heapify_max(data, length: int) -> None:
+    """
+    Helper function to arrange the first length elements of data into a
+    max-heap in O(N)
+    """
+    parent_index = (length // 2) - 1
+    while parent_index >= 0:
+        _sift_down_max(data, parent_index, length)
+        parent_index -= 1
+
+
+def _sift_down_max(data, index: int, length: int) -> None:
+    """
+    Helper function to move the element at index down within the first
+    length elements of a max-heap, mirroring _sift_down
+    """
+    node = data[index]
+    child_index = 2 * index + 1
+    while child_index < length:
+        child = data[child_index]
+        right_index = child_index + 1
+        if right_index < length:
+            right = data[right_index]
+            if child < right:
+                child_index = right_index
+                child = right
+        if not node < child:
+            break
+        data[index] = child
+        index = child_index
+        child_index = 2 * index + 1
+    data[index] = node
 
 # ------------------- BASIC TESTING -----------------------------------------
 
@@ -247,3 +1210,83 @@ if __name__ == '__main__':
     print(h)
     print(h.clear())
     print(h)
+
+    import tempfile
+    snapshot_dir = tempfile.TemporaryDirectory()
+    snapshot = snapshot_dir.name + "/heap.snap"
+
+    print("\nsave / load example 1")
+    print("--------------------")
+    h = MinHeap([100, 20, 6, 200, 90, 150, 300], typecode='q', arity=3)
+    h.save(snapshot)
+    for use_mmap in (True, False):
+        loaded = MinHeap.load(snapshot, mmap=use_mmap)
+        print(loaded)
+        print(loaded.pop_many(7))
+    h = MinHeap(['monkey', 'zebra', 'elephant', 'horse', 'bear'])
+    h.save(snapshot)
+    print(MinHeap.load(snapshot).pop_many(5))
+
+    print("\nsave / load example 2")
+    print("--------------------")
+    h = MinHeap(['monkey', 'zebra', 'elephant', 'horse', 'bear'], key=len)
+    h.save(snapshot)
+    try:
+        MinHeap.load(snapshot)
+    except MinHeapException as e:
+        print("Exception raised:", type(e))
+    loaded = MinHeap.load(snapshot, key=len)
+    loaded.add('cat')
+    print(loaded.pop_many(6))
+    DynamicArray([5, 3, 8, 1], typecode='q').save(snapshot)
+    print(MinHeap.load(snapshot).pop_many(4))
+
+    print("\nattach / refresh example 1")
+    print("--------------------------")
+    backing = snapshot_dir.name + "/heap.bin"
+    writer = MinHeap([100, 20, 6, 200], typecode='q', path=backing)
+    writer.flush()
+    reader = MinHeap.attach(backing)
+    print(reader, reader.get_min())
+    writer.add(1)
+    writer.add(300)
+    print(reader.size())
+    writer.flush()
+    reader.refresh()
+    print(reader, reader.get_min())
+    for method, args in (("add", (5,)), ("remove_min", ()), ("clear", ())):
+        try:
+            getattr(reader, method)(*args)
+            print(method, "allowed")
+        except DynamicArrayException as e:
+            print(method, "- Exception raised:", type(e))
+    reader.close()
+
+    print("\nattach / refresh example 2")
+    print("--------------------------")
+    writer.remove_min()
+    writer.close()
+    resumed = MinHeap.attach(backing, readonly=False)
+    resumed.add(50)
+    print(resumed)
+    resumed.close()
+    reader = MinHeap.attach(backing)
+    print(reader, reader.get_min())
+    reader.close()
+
+    print("\nfrom_dynamic_array example 1")
+    print("----------------------------")
+    da = DynamicArray([9, 4, 7, 1, 8, 2])
+    h = MinHeap.from_dynamic_array(da.view(1, 4), copy=False)
+    h.add(0)
+    print(h, da)
+    print(h.remove_min(), h.remove_min(), h)
+
+    print("\nheapsort example 3")
+    print("------------------")
+    da = DynamicArray([100, 20, 6, 200, 90, 150, 300])
+    heapsort(da, True)
+    print(da)
+    da = DynamicArray(['monkey', 'zebra', 'elephant', 'horse', 'bear'])
+    heapsort(da, False, len, arity=3)
+    print(da)
@@ -0,0 +1,258 @@
+# Name: Seongyeong Ju
+# OSU Email: jus@oregonstate.edu
+# Course: CS261 - Data Structures
+# Description: MinHeap sharded across several independently locked heaps
+
+
+import itertools
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+from min_heap import *
+
+
+class ShardedMinHeap:
+    """
+    MinHeap spread over several shard MinHeaps, each with its own lock, so
+    producers adding to different shards do not serialize on one lock
+    A small IndexedMinHeap over the shard minimums (the top-of-shards heap)
+    keeps get_min() and remove_min() exact across all shards
+    Locks are always taken top-of-shards first, then shard, to avoid deadlock
+    """
+
+    def __init__(self, shards: int = 4, routing: str = "round_robin",
+                 key=None, typecode=None, arity: int = 2):
+        """
+        Initialize a new ShardedMinHeap with the given number of shards
+        routing is "round_robin" or "hash" (shard chosen by hash(object), so
+        objects must be hashable)
+        A key function is computed once per object; ties are broken by global
+        insertion order. typecode and arity are passed to every shard
+        """
+        if shards < 1 or routing not in ("round_robin", "hash"):
+            raise MinHeapException
+        if key is not None and typecode is not None:
+            raise MinHeapException
+        self._shards = DynamicArray()
+        self._locks = DynamicArray()
+        for _ in range(shards):
+            self._shards.append(MinHeap(typecode=typecode, arity=arity))
+            self._locks.append(threading.Lock())
+        self._routing = routing
+        self._route = itertools.count()
+        self._key = key
+        self._counter = itertools.count()
+        self._top = IndexedMinHeap()
+        self._top_handles = DynamicArray(typecode='q')
+        for _ in range(shards):
+            self._top_handles.append(-1)
+        self._top_lock = threading.Lock()
+
+    @classmethod
+    def build_parallel(cls, values, shards: int = None, max_workers: int = None,
+                       key=None, typecode=None, arity: int = 2) -> "ShardedMinHeap":
+        """
+        Returns a new ShardedMinHeap built from values by splitting them into
+        one chunk per shard and running build_heap on every chunk in a
+        separate process
+        Objects must be picklable
+        """
+        if shards is None:
+            shards = os.cpu_count() or 1
+        heap = cls(shards, key=key, typecode=typecode, arity=arity)
+
+        # deal values round-robin into one chunk per shard
+        chunks = DynamicArray()
+        for _ in range(shards):
+            chunks.append(DynamicArray(typecode=typecode))
+        position = 0
+        for node in values:
+            if key is not None:
+                node = (key(node), position, node)
+            chunks[position % shards].append(node)
+            position += 1
+        heap._counter = itertools.count(position)
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            built = executor.map(_build_shard, chunks, itertools.repeat(arity))
+            for index, shard in enumerate(built):
+                heap._shards[index] = shard
+                heap._refresh(index)
+        return heap
+
+    def __str__(self) -> str:
+        """
+        Return content of every shard in human-readable form
+        """
+        out = 'SHARDED HEAP ['
+        out += ', '.join(str(shard) for shard in self._shards)
+        return out + ']'
+
+    def add(self, node: object) -> None:
+        """
+        Adds new object to the shard chosen by the routing policy
+        Only adds that become their shard's minimum touch the top-of-shards
+        heap
+        """
+        entry = node
+        if self._key is not None:
+            entry = (self._key(node), next(self._counter), node)
+        if self._routing == "hash":
+            index = hash(node) % self._shards.length()
+        else:
+            index = next(self._route) % self._shards.length()
+
+        shard = self._shards[index]
+        with self._locks[index]:
+            shard.add(entry)
+            new_min = shard.size() == 1 or not shard.get_min() < entry
+        if new_min:
+            with self._top_lock:
+                self._refresh(index)
+
+    def get_min(self) -> object:
+        """
+        Returns the minimum object across all shards without removing it and
+        raises a MinHeapException if every shard is empty
+        """
+        with self._top_lock:
+            if self._top.is_empty():
+                raise MinHeapException
+            return self._item(self._top.get_priority(self._top.get_min_handle()))
+
+    def remove_min(self) -> object:
+        """
+        Removes the minimum object across all shards and returns it
+        Raises a MinHeapException if every shard is empty
+        """
+        with self._top_lock:
+            if self._top.is_empty():
+                raise MinHeapException
+            index = self._top.get_min()
+            with self._locks[index]:
+                entry = self._shards[index].remove_min()
+            self._refresh(index)
+            return self._item(entry)
+
+    def size(self) -> int:
+        """
+        Returns the number of objects stored across all shards
+        """
+        total = 0
+        for index in range(self._shards.length()):
+            with self._locks[index]:
+                total += self._shards[index].size()
+        return total
+
+    def is_empty(self) -> bool:
+        """
+        Returns True if every shard is empty and False otherwise
+        """
+        with self._top_lock:
+            return self._top.is_empty()
+
+    def shard_sizes(self) -> DynamicArray:
+        """
+        Returns a DynamicArray with the number of objects in every shard
+        """
+        sizes = DynamicArray(typecode='q')
+        for index in range(self._shards.length()):
+            with self._locks[index]:
+                sizes.append(self._shards[index].size())
+        return sizes
+
+    def _refresh(self, index: int) -> None:
+        """
+        Helper method to bring the top-of-shards entry for shard index in line
+        with the shard's current minimum, with the top-of-shards lock held
+        """
+        with self._locks[index]:
+            shard = self._shards[index]
+            handle = self._top_handles[index]
+            if shard.is_empty():
+                if handle >= 0:
+                    self._top.remove(handle)
+                    self._top_handles[index] = -1
+            elif handle >= 0:
+                self._top.update(handle, shard.get_min())
+            else:
+                self._top_handles[index] = self._top.add(index, shard.get_min())
+
+    def _item(self, entry: object) -> object:
+        """
+        Helper method to return the object stored in a shard entry
+        """
+        if self._key is None:
+            return entry
+        return entry[2]
+
+
+def _build_shard(chunk: DynamicArray, arity: int) -> MinHeap:
+    """
+    Helper function run in a worker process to heapify one shard
+    """
+    shard = MinHeap(arity=arity)
+    shard.build_heap(chunk)
+    return shard
+
+
+# ------------------- BASIC TESTING -----------------------------------------
+
+
+if __name__ == '__main__':
+
+    print("\nadd / remove_min example 1")
+    print("--------------------------")
+    h = ShardedMinHeap(shards=3)
+    for value in [100, 20, 6, 200, 90, 150, 300]:
+        h.add(value)
+    print(h)
+    print(h.shard_sizes(), h.size(), h.get_min())
+    while not h.is_empty():
+        print(h.remove_min(), end=' ')
+    print()
+    try:
+        h.remove_min()
+    except MinHeapException as e:
+        print("Exception raised:", type(e))
+
+    print("\nadd / remove_min example 2")
+    print("--------------------------")
+    h = ShardedMinHeap(shards=2, routing="hash", key=len)
+    for value in ['monkey', 'zebra', 'elephant', 'horse', 'bear', 'cat']:
+        h.add(value)
+    print(h.size(), h.get_min())
+    while not h.is_empty():
+        print(h.remove_min(), end=' ')
+    print()
+
+    print("\nbuild_parallel example 1")
+    print("------------------------")
+    h = ShardedMinHeap.build_parallel(range(1000, 0, -7), shards=4,
+                                      max_workers=2, typecode='q')
+    print(h.shard_sizes(), h.get_min())
+    print(DynamicArray(h.remove_min() for _ in range(5)))
+    h = ShardedMinHeap.build_parallel(['monkey', 'zebra', 'elephant', 'horse'],
+                                      shards=2, max_workers=2, key=len)
+    print(DynamicArray(h.remove_min() for _ in range(4)))
+
+    print("\nthreads example 1")
+    print("-----------------")
+    h = ShardedMinHeap(shards=4)
+
+    def produce(start):
+        for value in range(start, 4000, 4):
+            h.add(value)
+
+    producers = DynamicArray()
+    for start in range(4):
+        producers.append(threading.Thread(target=produce, args=(start,)))
+    for producer in producers:
+        producer.start()
+    for producer in producers:
+        producer.join()
+    drained = DynamicArray()
+    while not h.is_empty():
+        drained.append(h.remove_min())
+    print(h.size(), drained.length(), list(drained) == list(range(4000)))